@@ -2,12 +2,84 @@
 Sistema de Ranqueamento de Autoridade para Leiloeiros - VERSÃO REAL
 Analisa métricas de SEO e tecnologia usando dados reais extraídos do PDF.
 """
+import csv
 import json
-import pandas as pd
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict
+from urllib.parse import urlsplit
 import sys
 
+try:
+    import orjson
+except ImportError:
+    # orjson é opcional; sem ele usamos o json da biblioteca padrão
+    orjson = None
+
+def _ler_json(filepath: Path):
+    """Lê um arquivo JSON direto dos bytes (orjson quando disponível)"""
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
+    return json.loads(filepath.read_text(encoding='utf-8'))
+
+def _salvar_json(data, filepath: Path):
+    """Grava JSON indentado em UTF-8 (orjson quando disponível)"""
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        filepath.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+
+def _primeiros_da_categoria(results: List[Dict], categoria: str, n: int = 10) -> List[Dict]:
+    """Primeiros n resultados da categoria, sem varrer a lista inteira"""
+    return list(islice((r for r in results if r['categoria'] == categoria), n))
+
+# Critérios do TechScore para leiloeiros com site (bits da máscara)
+_EMAIL_CORPORATIVO = 1
+_DOMINIO_COM_BR = 2
+_DOMINIO_SIMPLES = 4
+
+def _montar_tabela_score() -> tuple:
+    """Pré-calcula (score, categoria, breakdown) para cada combinação de critérios"""
+    tabela = []
+    for mask in range(8):
+        breakdown = {}
+        # 1. Email corporativo: +40 pontos
+        if mask & _EMAIL_CORPORATIVO:
+            breakdown['email_corporativo'] = 40
+        # 2. Site extraído: +30 pontos
+        breakdown['site_extraido'] = 30
+        # 3. Domínio .com.br: +20 pontos
+        if mask & _DOMINIO_COM_BR:
+            breakdown['dominio_com_br'] = 20
+        # 4. Domínio sem subdomínio (apenas www): +10 pontos
+        if mask & _DOMINIO_SIMPLES:
+            breakdown['dominio_simples'] = 10
+        
+        score = sum(breakdown.values())
+        
+        # Classificação baseada no TechScore
+        if score > 75:
+            category = "Gigante (Portal)"
+        elif score >= 40:
+            category = "Médio (Consolidado)"
+        else:
+            category = "Pequeno (Site Básico)"
+        
+        tabela.append((score, category, tuple(breakdown.items())))
+    return tuple(tabela)
+
+_TABELA_SCORE = _montar_tabela_score()
+
+# Acima deste número de leiloeiros o cálculo é distribuído entre processos
+PARALLEL_THRESHOLD = 5000
+
+# Colunas do CSV, na ordem de escrita (breakdown e has_site ficam só no JSON)
+CSV_COLUMNS = ('nome', 'email', 'email_corporativo', 'site', 'fonte', 'tech_score', 'categoria')
+
 class RealAuctioneerRanker:
     """Classifica leiloeiros baseado em métricas simplificadas usando dados reais"""
     
@@ -21,8 +93,7 @@ class RealAuctioneerRanker:
             print(f"❌ Arquivo não encontrado: {input_path}")
             return []
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _ler_json(filepath)
         
         print(f"✅ {len(data)} leiloeiros reais carregados")
         return data
@@ -36,9 +107,6 @@ class RealAuctioneerRanker:
         4. Domínio sem subdomínio: +10 pontos
         Total máximo: 100 pontos
         """
-        score = 0
-        breakdown = {}
-        
         # Verifica se tem site
         has_site = 'site' in leiloeiro and leiloeiro['site'] and leiloeiro['site'] != 'N/A'
         
@@ -51,44 +119,34 @@ class RealAuctioneerRanker:
                 'has_site': False
             }
         
-        # 1. Email corporativo
-        if leiloeiro.get('email_corporativo', False):
-            score += 40
-            breakdown['email_corporativo'] = 40
+        # Um único parse da URL; porta, caminho e barra final não afetam o host.
+        # Sem esquema (ex.: lancejudicial.com.br) o urlsplit não reconhece o host, então
+        # o parse usa https:// na frente; o domínio simples continua exigindo https explícito
+        site = leiloeiro['site']
+        tem_esquema = '://' in site
+        parts = urlsplit(site if tem_esquema else f'https://{site}')
+        host = parts.hostname or ''
         
-        # 2. Site extraído
-        score += 30
-        breakdown['site_extraido'] = 30
-            
-        # 3. Domínio .com.br
-        if '.com.br' in leiloeiro['site']:
-            score += 20
-            breakdown['dominio_com_br'] = 20
-        
-        # 4. Domínio sem subdomínio (apenas www)
-        if leiloeiro['site'].startswith('https://www.') and leiloeiro['site'].count('.') == 3:
-            score += 10
-            breakdown['dominio_simples'] = 10
+        # Monta a máscara de critérios e busca score/categoria na tabela pré-calculada
+        mask = 0
+        if leiloeiro.get('email_corporativo', False):
+            mask |= _EMAIL_CORPORATIVO
+        if host.endswith('.com.br'):
+            mask |= _DOMINIO_COM_BR
+        if tem_esquema and parts.scheme == 'https' and host.startswith('www.') and host.count('.') == 3:
+            mask |= _DOMINIO_SIMPLES
         
-        # Classificação baseada no TechScore
-        if score > 75:
-            category = "Gigante (Portal)"
-        elif score >= 40:
-            category = "Médio (Consolidado)"
-        else:
-            category = "Pequeno (Site Básico)"
+        score, category, breakdown = _TABELA_SCORE[mask]
         
         return {
             'score': score,
             'category': category,
-            'breakdown': breakdown,
+            'breakdown': dict(breakdown),
             'has_site': True
         }
     
-    def analyze_all(self, data: List[Dict]) -> List[Dict]:
-        """Analisa todos os leiloeiros"""
-        print(f"\n📊 Analisando {len(data)} leiloeiros reais...")
-        
+    def analyze_chunk(self, data: List[Dict]) -> List[Dict]:
+        """Calcula o ranking de um lote de leiloeiros, na ordem recebida"""
         results = []
         for leiloeiro in data:
             ranking = self.calculate_tech_score(leiloeiro)
@@ -109,69 +167,74 @@ class RealAuctioneerRanker:
         
         return results
     
-    def save_to_csv(self, results: List[Dict], output_path: str = "data/relatorio_final_ranking.csv"):
-        """Salva os resultados em CSV ordenado por tech_score (oportunidades primeiro)"""
-        # Ordena por tech_score (ascendente - oportunidades primeiro)
-        sorted_results = sorted(results, key=lambda x: x['tech_score'])
+    def analyze_all(self, data: List[Dict]) -> List[Dict]:
+        """Analisa todos os leiloeiros e ordena por tech_score (oportunidades primeiro)"""
+        print(f"\n📊 Analisando {len(data)} leiloeiros reais...")
         
-        # Converte para DataFrame
-        df = pd.DataFrame(sorted_results)
+        # Listas grandes são divididas em lotes processados em paralelo (ordem preservada)
+        if len(data) > PARALLEL_THRESHOLD:
+            workers = os.cpu_count() or 1
+            chunk_size = -(-len(data) // workers)
+            chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(chain.from_iterable(executor.map(self.analyze_chunk, chunks)))
+        else:
+            results = self.analyze_chunk(data)
         
-        # Remove coluna breakdown (não é útil no CSV)
-        if 'breakdown' in df.columns:
-            df = df.drop(columns=['breakdown'])
-        if 'has_site' in df.columns:
-            df = df.drop(columns=['has_site'])
+        # Ordena uma única vez por tech_score (ascendente, estável); CSV e JSON reutilizam a ordem
+        results.sort(key=itemgetter('tech_score'))
         
+        return results
+    
+    def save_to_csv(self, results: List[Dict], output_path: str = "data/relatorio_final_ranking.csv") -> List[Dict]:
+        """Salva os resultados (já ordenados por analyze_all) em CSV"""
         # Garante que o diretório existe
         filepath = Path(output_path)
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        # Salva em CSV
-        df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        # Salva em CSV apenas as colunas úteis, sem materializar cópias dos resultados
+        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, CSV_COLUMNS, extrasaction='ignore', lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(results)
         
         print(f"\n💾 CSV salvo em: {output_path}")
-        print(f"📊 Total de leiloeiros: {len(df)}")
+        print(f"📊 Total de leiloeiros: {len(results)}")
         
         # Estatísticas
-        categories = df['categoria'].value_counts()
+        categories = Counter(r['categoria'] for r in results)
         print("\n📈 Distribuição por categoria:")
-        for cat, count in categories.items():
+        for cat, count in categories.most_common():
             print(f"   {cat}: {count} leiloeiros")
         
-        # Top pequenos (site básico)
+        # Top pequenos (site básico) - results já está ordenado, para no 10º encontrado
         print("\n🔍 TOP 10 PEQUENOS (Site Básico):")
-        pequenos = df[df['categoria'] == 'Pequeno (Site Básico)'].head(10)
-        for idx, row in pequenos.iterrows():
-            print(f"   • {row['nome']} - TechScore: {row['tech_score']}")
+        for r in _primeiros_da_categoria(results, 'Pequeno (Site Básico)'):
+            print(f"   • {r['nome']} - TechScore: {r['tech_score']}")
         
         # Top gigantes
         print("\n🏆 TOP 10 GIGANTES (Portal):")
-        gigantes = df[df['categoria'] == 'Gigante (Portal)'].head(10)
-        if len(gigantes) > 0:
-            for idx, row in gigantes.iterrows():
-                print(f"   • {row['nome']} - TechScore: {row['tech_score']}")
+        gigantes = _primeiros_da_categoria(results, 'Gigante (Portal)')
+        if gigantes:
+            for r in gigantes:
+                print(f"   • {r['nome']} - TechScore: {r['tech_score']}")
         else:
             print("   Nenhum gigante identificado")
         
-        return df
+        return results
     
     def save_to_json(self, results: List[Dict], output_path: str = "data/processed/ranking_final.json"):
-        """Salva os resultados completos em JSON"""
-        # Ordena por tech_score (ascendente - oportunidades primeiro)
-        sorted_results = sorted(results, key=lambda x: x['tech_score'])
-        
+        """Salva os resultados completos (já ordenados por analyze_all) em JSON"""
         # Garante que o diretório existe
         filepath = Path(output_path)
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
         # Salva em JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(sorted_results, f, ensure_ascii=False, indent=2)
+        _salvar_json(results, filepath)
         
         print(f"\n💾 JSON salvo em: {output_path}")
         
-        return sorted_results
+        return results
 
 def main():
     """Função principal"""
@@ -206,7 +269,7 @@ def main():
         print("-" * 70)
         
         # Salva CSV
-        df = ranker.save_to_csv(results)
+        ranker.save_to_csv(results)
         
         # Salva JSON
         json_data = ranker.save_to_json(results)
@@ -218,11 +281,19 @@ def main():
         
         total_leiloeiros = len(results)
         
-        # Contagem por categoria
-        gigantes = len([r for r in results if r['categoria'] == 'Gigante (Portal)'])
-        medios = len([r for r in results if r['categoria'] == 'Médio (Consolidado)'])
-        pequenos = len([r for r in results if r['categoria'] == 'Pequeno (Site Básico)'])
-        offline = len([r for r in results if r['categoria'] == 'Offline (Sem Site)'])
+        # Contagem por categoria, emails corporativos e sites em uma única passada
+        categorias = Counter()
+        corporativos = 0
+        com_site = 0
+        for r in results:
+            categorias[r['categoria']] += 1
+            corporativos += bool(r['email_corporativo'])
+            com_site += bool(r['has_site'])
+        
+        gigantes = categorias['Gigante (Portal)']
+        medios = categorias['Médio (Consolidado)']
+        pequenos = categorias['Pequeno (Site Básico)']
+        offline = categorias['Offline (Sem Site)']
         
         oportunidades_online = medios + pequenos
         
@@ -234,12 +305,10 @@ def main():
         print(f"💡 OPORTUNIDADES ONLINE (Médios + Pequenos): {oportunidades_online}")
         
         # Porcentagem de emails corporativos
-        corporativos = len([r for r in results if r['email_corporativo']])
         perc_corporativos = (corporativos / total_leiloeiros * 100) if total_leiloeiros > 0 else 0
         print(f"📧 EMAILS CORPORATIVOS: {corporativos} ({perc_corporativos:.1f}%)")
         
         # Porcentagem com site
-        com_site = len([r for r in results if r['has_site']])
         perc_site = (com_site / total_leiloeiros * 100) if total_leiloeiros > 0 else 0
         print(f"🌐 COM SITE: {com_site} ({perc_site:.1f}%)")
         print(f"📴 SEM SITE: {offline} ({100 - perc_site:.1f}%)")
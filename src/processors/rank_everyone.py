@@ -5,93 +5,93 @@ Processa a lista completa sem excluir ninguém
 """
 
 import json
-import pandas as pd
+import re
+import shutil
 from pathlib import Path
 import sys
 
-def calcular_tech_score(leiloeiro):
-    """Calcula TechScore baseado em site, email e outros fatores"""
-    score = 0
-    
-    # Site (0-50 pontos)
-    site = leiloeiro.get('site')
-    if site and site != 'null' and site != 'Não Identificado' and site is not None:
-        # Site válido: 30 pontos
-        score += 30
-        
-        # Site profissional (não é domínio de email)
-        email_domains = ['outlook', 'gmail', 'hotmail', 'yahoo', 'uol', 'bol', 'terra', 'ig', 'me.com']
-        site_lower = str(site).lower()
-        if not any(domain in site_lower for domain in email_domains):
-            # Site corporativo: +20 pontos
-            score += 20
-    
-    # Email corporativo (0-30 pontos)
-    email = leiloeiro.get('email')
-    if email and email != 'null' and email is not None:
-        # Email válido: 10 pontos
-        score += 10
-        
-        # Email corporativo (não é gmail/hotmail/etc)
-        email_lower = str(email).lower()
-        if not ('@gmail.' in email_lower or '@hotmail.' in email_lower or 
-                '@yahoo.' in email_lower or '@outlook.' in email_lower or
-                '@uol.' in email_lower or '@bol.' in email_lower):
-            # Email corporativo: +20 pontos
-            score += 20
-    
-    # Telefone (0-10 pontos)
-    telefone = leiloeiro.get('telefone')
-    if telefone and telefone != 'null' and telefone is not None:
-        score += 10
-    
-    # Matrícula (0-10 pontos)
-    matricula = leiloeiro.get('matricula')
-    if matricula and matricula != 'null' and matricula is not None:
-        score += 10
-    
-    return min(score, 100)  # Máximo 100
+try:
+    import orjson
+except ImportError:
+    # orjson é opcional; sem ele usamos o json da biblioteca padrão
+    orjson = None
 
-def limpar_sites_falsos(leiloeiros):
-    """Limpa sites falsos (domínios de email)"""
-    email_domains = ['outlook', 'gmail', 'hotmail', 'yahoo', 'uol', 'bol', 'terra', 'ig', 'me.com']
-    
+def _ler_json(filepath: Path):
+    """Lê um arquivo JSON direto dos bytes (orjson quando disponível)"""
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
+    return json.loads(filepath.read_text(encoding='utf-8'))
+
+def _salvar_json(data, filepath: Path):
+    """Grava JSON indentado em UTF-8 (orjson quando disponível)"""
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        filepath.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+
+# Domínios de email que não contam como site próprio
+_EMAIL_DOMAINS = ('outlook', 'gmail', 'hotmail', 'yahoo', 'uol', 'bol', 'terra', 'ig', 'me.com')
+_EMAIL_DOMAIN_RE = re.compile('|'.join(re.escape(domain) for domain in _EMAIL_DOMAINS))
+
+# Provedores gratuitos que descaracterizam um email corporativo
+_EMAIL_PROVIDERS = ('gmail', 'hotmail', 'yahoo', 'outlook', 'uol', 'bol')
+_EMAIL_PROVIDERS_AT = tuple(f'@{domain}.' for domain in _EMAIL_PROVIDERS)
+
+def processar_leiloeiros(leiloeiros):
+    """Limpa sites falsos, calcula TechScore e classifica em uma única passada"""
     for leiloeiro in leiloeiros:
-        site = leiloeiro.get('site')
+        score = 0
         
-        if not site or site == 'null' or site == 'Não Identificado' or site is None:
-            leiloeiro['site'] = None
-            continue
-            
-        site_str = str(site).lower()
-        if any(domain in site_str for domain in email_domains):
-            leiloeiro['site'] = None
+        # Site (0-50 pontos): domínios de email não contam como site
+        site = leiloeiro.get('site')
+        if not site or site == 'null' or site == 'Não Identificado':
+            site = None
+        elif _EMAIL_DOMAIN_RE.search(str(site).lower()):
+            site = None
         else:
             # Adicionar https:// se não tiver
-            if site and not site.startswith(('http://', 'https://')):
-                leiloeiro['site'] = f'https://{site}'
-    
-    return leiloeiros
-
-def classificar_inclusivo(leiloeiros):
-    """Classifica leiloeiros sem excluir ninguém (4 categorias)"""
-    for leiloeiro in leiloeiros:
-        site = leiloeiro.get('site')
-        tech_score = leiloeiro.get('tech_score', 0)
+            if not site.startswith(('http://', 'https://')):
+                site = f'https://{site}'
+            # Site válido (30) + site corporativo (20)
+            score += 50
+        leiloeiro['site'] = site
+        
+        # Email (0-30 pontos)
+        email = leiloeiro.get('email')
+        email_lower = str(email or '').lower()
+        if email and email != 'null':
+            # Email válido: 10 pontos
+            score += 10
+            # Email corporativo (não é gmail/hotmail/etc): +20 pontos
+            if not any(domain in email_lower for domain in _EMAIL_PROVIDERS_AT):
+                score += 20
         
-        # Se não tem site válido -> Offline/Sem Site
+        # Telefone (0-10 pontos)
+        telefone = leiloeiro.get('telefone')
+        if telefone and telefone != 'null':
+            score += 10
+        
+        # Matrícula (0-10 pontos)
+        matricula = leiloeiro.get('matricula')
+        if matricula and matricula != 'null':
+            score += 10
+        
+        # Classificar (inclusivo - ninguém excluído)
         if not site:
-            leiloeiro['categoria'] = 'Offline/Sem Site'
-            leiloeiro['tech_score'] = 0  # Garante score 0 para offline
-            continue
-            
-        # Tem site válido, classificar por TechScore
-        if tech_score > 80:
-            leiloeiro['categoria'] = 'Gigante (Portal)'
-        elif tech_score >= 40:
-            leiloeiro['categoria'] = 'Médio (Consolidado)'
+            categoria = 'Offline/Sem Site'
+            score = 0  # Garante score 0 para offline
+        elif score > 80:
+            categoria = 'Gigante (Portal)'
+        elif score >= 40:
+            categoria = 'Médio (Consolidado)'
         else:
-            leiloeiro['categoria'] = 'Pequeno (Com Site)'
+            categoria = 'Pequeno (Com Site)'
+        
+        leiloeiro['tech_score'] = min(score, 100)  # Máximo 100
+        # Reaproveita email_corporativo quando a entrada (ex.: dados enriquecidos) já o traz
+        if 'email_corporativo' not in leiloeiro:
+            leiloeiro['email_corporativo'] = not any(domain in email_lower for domain in _EMAIL_PROVIDERS)
+        leiloeiro['categoria'] = categoria
     
     return leiloeiros
 
@@ -110,28 +110,16 @@ def main():
     print(f"📁 Carregando dados de: {input_path}")
     
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            leiloeiros = json.load(f)
+        leiloeiros = _ler_json(input_path)
     except Exception as e:
         print(f"❌ Erro ao carregar JSON: {e}")
         sys.exit(1)
     
     print(f"✅ Dados carregados: {len(leiloeiros)} leiloeiros")
     
-    # Limpar sites falsos
-    print("\n🧹 Limpando sites falsos (domínios de email)...")
-    leiloeiros = limpar_sites_falsos(leiloeiros)
-    
-    # Calcular TechScore
-    print("📊 Calculando TechScore...")
-    for leiloeiro in leiloeiros:
-        leiloeiro['tech_score'] = calcular_tech_score(leiloeiro)
-        leiloeiro['email_corporativo'] = not any(domain in str(leiloeiro.get('email', '')).lower() 
-                                                for domain in ['gmail', 'hotmail', 'yahoo', 'outlook', 'uol', 'bol'])
-    
-    # Classificar (inclusivo - ninguém excluído)
-    print("🏷️ Classificando leiloeiros (4 categorias inclusivas)...")
-    leiloeiros = classificar_inclusivo(leiloeiros)
+    # Limpar sites falsos, calcular TechScore e classificar (inclusivo - ninguém excluído)
+    print("\n🧹 Limpando sites falsos, calculando TechScore e classificando (4 categorias inclusivas)...")
+    leiloeiros = processar_leiloeiros(leiloeiros)
     
     # Gerar relatório
     total = len(leiloeiros)
@@ -143,21 +131,25 @@ def main():
         cat = leiloeiro['categoria']
         categorias[cat] = categorias.get(cat, 0) + 1
     
-    print("\n" + "=" * 60)
-    print("📊 RELATÓRIO FINAL (INCLUSIVO)")
-    print("=" * 60)
-    print(f"Total de leiloeiros: {total}")
-    print(f"Com site válido: {com_site} ({com_site/total*100:.1f}%)")
-    print(f"Offline/Sem site: {offline} ({offline/total*100:.1f}%)")
-    print("\n📈 Distribuição por categoria:")
+    # Relatório montado em memória e emitido com uma única escrita no stdout
+    linhas = [
+        "\n" + "=" * 60,
+        "📊 RELATÓRIO FINAL (INCLUSIVO)",
+        "=" * 60,
+        f"Total de leiloeiros: {total}",
+        f"Com site válido: {com_site} ({com_site/total*100:.1f}%)",
+        f"Offline/Sem site: {offline} ({offline/total*100:.1f}%)",
+        "\n📈 Distribuição por categoria:",
+    ]
     for cat, count in categorias.items():
-        print(f"  • {cat}: {count} ({count/total*100:.1f}%)")
+        linhas.append(f"  • {cat}: {count} ({count/total*100:.1f}%)")
     
     # Calcular TechScore médio (apenas para quem tem site)
     tech_scores = [l['tech_score'] for l in leiloeiros if l.get('site')]
     if tech_scores:
         avg_score = sum(tech_scores) / len(tech_scores)
-        print(f"\n🎯 TechScore médio (com site): {avg_score:.1f}")
+        linhas.append(f"\n🎯 TechScore médio (com site): {avg_score:.1f}")
+    sys.stdout.write("\n".join(linhas) + "\n")
     
     # Salvar resultados
     output_csv = Path("data/relatorio_final_ranking.csv")
@@ -166,7 +158,8 @@ def main():
     output_csv.parent.mkdir(parents=True, exist_ok=True)
     output_json.parent.mkdir(parents=True, exist_ok=True)
     
-    # Salvar CSV
+    # Salvar CSV (pandas só é importado aqui, os caminhos de erro acima não pagam o custo)
+    import pandas as pd
     df = pd.DataFrame(leiloeiros)
     
     # Reordenar colunas para melhor visualização
@@ -181,32 +174,35 @@ def main():
     print(f"\n💾 CSV salvo: {output_csv}")
     
     # Salvar JSON
-    with open(output_json, 'w', encoding='utf-8') as f:
-        json.dump(leiloeiros, f, ensure_ascii=False, indent=2)
+    _salvar_json(leiloeiros, output_json)
     print(f"💾 JSON salvo: {output_json}")
     
     # Salvar também como relatorio_final.csv (para compatibilidade com dashboard)
+    # Copia os bytes já gravados em vez de formatar o CSV de novo
     compat_csv = Path("data/relatorio_final.csv")
-    df.to_csv(compat_csv, index=False, encoding='utf-8')
+    shutil.copyfile(output_csv, compat_csv)
     print(f"💾 CSV de compatibilidade: {compat_csv}")
     
-    print("\n" + "=" * 60)
-    print("✅ PROCESSAMENTO CONCLUÍDO!")
-    print("=" * 60)
+    linhas = [
+        "\n" + "=" * 60,
+        "✅ PROCESSAMENTO CONCLUÍDO!",
+        "=" * 60,
+    ]
     
     # Mostrar exemplos
-    print("\n📋 EXEMPLOS DE CLASSIFICAÇÃO (primeiros 5):")
+    linhas.append("\n📋 EXEMPLOS DE CLASSIFICAÇÃO (primeiros 5):")
     for i, leiloeiro in enumerate(leiloeiros[:5]):
-        print(f"\n{i+1}. {leiloeiro['nome']}")
-        print(f"   Site: {leiloeiro.get('site', 'Nenhum')}")
-        print(f"   TechScore: {leiloeiro['tech_score']}")
-        print(f"   Categoria: {leiloeiro['categoria']}")
-    
-    print(f"\n🎯 OPORTUNIDADES DE NEGÓCIO:")
-    print(f"   • Offline/Sem Site: {categorias.get('Offline/Sem Site', 0)} leiloeiros")
-    print(f"   • Pequeno (Com Site): {categorias.get('Pequeno (Com Site)', 0)} leiloeiros")
+        linhas.append(f"\n{i+1}. {leiloeiro['nome']}")
+        linhas.append(f"   Site: {leiloeiro.get('site', 'Nenhum')}")
+        linhas.append(f"   TechScore: {leiloeiro['tech_score']}")
+        linhas.append(f"   Categoria: {leiloeiro['categoria']}")
+    
     oportunidades = categorias.get('Offline/Sem Site', 0) + categorias.get('Pequeno (Com Site)', 0)
-    print(f"   • TOTAL OPORTUNIDADES: {oportunidades} ({oportunidades/total*100:.1f}%)")
+    linhas.append(f"\n🎯 OPORTUNIDADES DE NEGÓCIO:")
+    linhas.append(f"   • Offline/Sem Site: {categorias.get('Offline/Sem Site', 0)} leiloeiros")
+    linhas.append(f"   • Pequeno (Com Site): {categorias.get('Pequeno (Com Site)', 0)} leiloeiros")
+    linhas.append(f"   • TOTAL OPORTUNIDADES: {oportunidades} ({oportunidades/total*100:.1f}%)")
+    sys.stdout.write("\n".join(linhas) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -3,16 +3,48 @@ Classificador Inclusivo Final - Processa dados brutos com nova lógica
 Não descarta leiloeiros, categoriza todos com 4 categorias explícitas.
 """
 import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import List, Dict
 import re
 
+try:
+    import orjson
+except ImportError:
+    # orjson é opcional; sem ele o JSON é lido e gravado com a biblioteca padrão
+    orjson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import parquet as pq
+except ImportError:
+    # pyarrow é opcional; sem ele o Parquet não é gerado
+    pa = None
+
+# Limpeza de nomes: números/pontuação no final e caracteres especiais no início
+_TRAIL_RE = re.compile(r'[\d\s\-\./]+$')
+_LEAD_RE = re.compile(r'^[_\W]+')
+
 class InclusiveRanker:
     """Classifica todos os leiloeiros sem descartar ninguém"""
     
-    def __init__(self, input_path: str = "data/processed/leiloeiros_enriquecidos_final_v2.json"):
+    # Provedores de email genéricos (não corporativos); tupla para str.endswith em uma chamada
+    GENERIC_DOMAINS = (
+        'gmail.com', 'hotmail.com', 'outlook.com', 'yahoo.com',
+        'uol.com.br', 'bol.com.br', 'terra.com.br', 'ig.com.br',
+        'globo.com', 'live.com', 'msn.com', 'aol.com',
+        'gmail.com.br', 'hotmail.com.br', 'yahoo.com.br'
+    )
+    
+    # Categorias da nova lógica, da maior para a menor presença digital
+    CATEGORIAS = ['Gigante (Portal)', 'Médio (Consolidado)', 'Pequeno (Com Site)', 'Offline/Sem Site']
+    
+    def __init__(self, input_path: str = "data/processed/leiloeiros_enriquecidos_final_v2.json",
+                 parquet: bool = False):
         self.input_path = Path(input_path)
+        # Opcional: grava também um Parquet ao lado do CSV (requer pyarrow)
+        self.parquet = parquet
         self.df = None
         
     def load_data(self) -> pd.DataFrame:
@@ -30,135 +62,16 @@ class InclusiveRanker:
             else:
                 return pd.DataFrame()
         
-        with open(self.input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(self.input_path.read_bytes())
+        else:
+            with open(self.input_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         self.df = pd.DataFrame(data)
         print(f"✅ Dados carregados: {len(self.df)} leiloeiros ({self.input_path.name})")
         return self.df
     
-    def is_corporate_email(self, email: str) -> bool:
-        """Verifica se o email é corporativo"""
-        if not email or pd.isna(email):
-            return False
-        
-        generic_domains = {
-            'gmail.com', 'hotmail.com', 'outlook.com', 'yahoo.com',
-            'uol.com.br', 'bol.com.br', 'terra.com.br', 'ig.com.br',
-            'globo.com', 'live.com', 'msn.com', 'aol.com',
-            'gmail.com.br', 'hotmail.com.br', 'yahoo.com.br'
-        }
-        
-        domain = email.split('@')[-1].lower()
-        return not any(domain.endswith(generic) for generic in generic_domains)
-    
-    def extract_site_from_email(self, email: str, existing_site: str = None) -> str:
-        """
-        Extrai site do email corporativo.
-        Para emails genéricos, retorna "Não Identificado".
-        Se já existe site no dado enriquecido, usa ele.
-        """
-        # Se já tem site no dado enriquecido, usa ele
-        if existing_site and not pd.isna(existing_site) and existing_site:
-            return existing_site
-        
-        if not email or pd.isna(email) or email == "":
-            return "Não Identificado"
-        
-        if not self.is_corporate_email(email):
-            return "Não Identificado"
-        
-        domain = email.split('@')[-1]
-        domain_parts = domain.split('.')
-        
-        if len(domain_parts) >= 2:
-            if domain_parts[-1] == 'br' and len(domain_parts) >= 3:
-                main_domain = '.'.join(domain_parts[-3:])
-            else:
-                main_domain = '.'.join(domain_parts[-2:])
-            
-            return f"https://www.{main_domain}"
-        
-        return "Não Identificado"
-    
-    def calculate_tech_score(self, email: str, site: str) -> int:
-        """
-        Calcula TechScore (0-100):
-        - Email corporativo: +40
-        - Site extraído: +30
-        - Domínio .com.br: +20
-        - Domínio simples: +10
-        - Email genérico: +5 (mínimo)
-        - Sem email: 0
-        """
-        score = 0
-        
-        if not email or pd.isna(email):
-            return 0
-        
-        # Email genérico: +5 (mínimo)
-        if not self.is_corporate_email(email):
-            score = 5
-        else:
-            # Email corporativo: +40
-            score += 40
-            
-            # Site extraído
-            if site and site != "Não Identificado" and site != "":
-                score += 30
-                
-                # Domínio .com.br
-                if '.com.br' in site:
-                    score += 20
-                else:
-                    score += 10
-        
-        return min(score, 100)
-    
-    def determine_category(self, site: str, tech_score: int) -> str:
-        """
-        Determina categoria baseada na nova lógica:
-        1. Gigante (Portal): Site identificado + TechScore > 80
-        2. Médio (Consolidado): Site identificado + TechScore 40-80
-        3. Pequeno (Com Site): Site identificado + TechScore < 40
-        4. Offline/Sem Site: Site "Não Identificado"
-        """
-        if site == "Não Identificado" or not site or site == "":
-            return "Offline/Sem Site"
-        
-        if tech_score > 80:
-            return "Gigante (Portal)"
-        elif tech_score >= 40:
-            return "Médio (Consolidado)"
-        else:
-            return "Pequeno (Com Site)"
-    
-    def clean_nome(self, nome: str) -> str:
-        """Limpa o nome do leiloeiro"""
-        if not nome or pd.isna(nome):
-            return "Nome Não Identificado"
-        
-        # Remove "Licensed to..." e outros prefixos
-        if isinstance(nome, str) and nome.startswith("Licensed to"):
-            return "Leiloeiro Extraído"
-        
-        # Remove números e caracteres especiais no final
-        nome = re.sub(r'[\d\s\-\./]+$', '', str(nome))
-        
-        # Remove caracteres especiais no início
-        nome = re.sub(r'^[_\W]+', '', nome)
-        
-        # Remove espaços extras
-        nome = nome.strip()
-        
-        # Capitaliza se tudo for minúsculo
-        if nome and nome.islower():
-            words = nome.split()
-            capitalized_words = [word.capitalize() for word in words]
-            nome = ' '.join(capitalized_words)
-        
-        return nome if nome else "Nome Não Identificado"
-    
     def process_all(self) -> pd.DataFrame:
         """Processa todos os leiloeiros"""
         print("\n🔬 PROCESSANDO TODOS OS LEILOEIROS")
@@ -168,51 +81,92 @@ class InclusiveRanker:
             print("❌ Nenhum dado para processar")
             return pd.DataFrame()
         
-        processed_rows = []
-        
-        for idx, row in self.df.iterrows():
-            # Limpa o nome
-            nome_limpo = self.clean_nome(row.get('nome', ''))
-            
-            # Obtém email (do dado enriquecido)
-            email = row.get('email', '')
-            
-            # Obtém site existente (do dado enriquecido)
-            existing_site = row.get('site', None)
-            
-            # Extrai site (usa existente ou extrai do email)
-            site = self.extract_site_from_email(email, existing_site)
-            
-            # Calcula TechScore
-            tech_score = self.calculate_tech_score(email, site)
-            
-            # Determina categoria
-            categoria = self.determine_category(site, tech_score)
-            
-            # Verifica se é email corporativo
-            email_corporativo = self.is_corporate_email(email) if email else False
-            
-            # Cria registro processado
-            processed_row = {
-                'nome': nome_limpo,
-                'email': email if email else "",
-                'email_corporativo': email_corporativo,
-                'site': site,
-                'tech_score': tech_score,
-                'categoria': categoria,
-                'fonte': row.get('fonte_clean', row.get('fonte', 'pdf_enriquecido')),
-                'pagina': row.get('pagina', 0),
-                'enriquecido': row.get('enriquecido', False)
-            }
-            
-            processed_rows.append(processed_row)
-        
-        # Cria DataFrame processado
-        processed_df = pd.DataFrame(processed_rows)
-        
-        # Remove duplicados baseado no email (mantém o primeiro)
-        if 'email' in processed_df.columns:
-            processed_df = processed_df.drop_duplicates(subset=['email'], keep='first')
+        df = self.df
+        
+        def coluna(nome: str, padrao) -> pd.Series:
+            """Coluna do DataFrame de entrada, ou uma constante se ela não existir"""
+            if nome in df.columns:
+                return df[nome]
+            return pd.Series(padrao, index=df.index, dtype=object)
+        
+        # Nome: "Licensed to..." vira "Leiloeiro Extraído"; remove números/pontuação no final e
+        # caracteres especiais no início; capitaliza nomes todo em minúsculas.
+        # Coluna toda vazia chega como float64 (só NaN): object + fillna antes de qualquer .str
+        nome_raw = coluna('nome', '').astype(object)
+        sem_nome = nome_raw.isna() | nome_raw.eq('')
+        nome_raw = nome_raw.fillna('')
+        licensed = nome_raw.str.startswith("Licensed to").fillna(False).astype(bool)
+        nome = (nome_raw.astype(str)
+                .str.replace(_TRAIL_RE, '', regex=True)
+                .str.replace(_LEAD_RE, '', regex=True)
+                .str.strip())
+        minusculo = nome.str.islower().fillna(False).astype(bool)
+        if minusculo.any():
+            nome = nome.mask(minusculo, nome[minusculo].str.split().str.join(' ').str.title())
+        nome = nome.where(nome.ne('') & ~sem_nome, "Nome Não Identificado")
+        nome = nome.mask(licensed & ~sem_nome, "Leiloeiro Extraído")
+        
+        # Email e domínio: um único split por coluna
+        email = coluna('email', '').astype(object).fillna('').astype(str)
+        has_email = email.ne('')
+        domain = email.str.rsplit('@', n=1).str[-1]
+        is_corp = has_email & ~domain.str.lower().str.endswith(self.GENERIC_DOMAINS)
+        
+        # Site extraído do email corporativo (domínio principal, 3 partes para .br)
+        domain_parts = domain.str.split('.')
+        n_parts = domain_parts.str.len()
+        main_domain = domain_parts.str[-2:].str.join('.').mask(
+            domain_parts.str[-1].eq('br') & (n_parts >= 3),
+            domain_parts.str[-3:].str.join('.'))
+        extracted_site = ('https://www.' + main_domain).where(is_corp & (n_parts >= 2), "Não Identificado")
+        
+        # Site existente no dado enriquecido tem prioridade
+        existing_site = coluna('site', None).astype(object)
+        site = existing_site.where(existing_site.notna() & existing_site.ne(''), extracted_site)
+        
+        # TechScore e categoria
+        has_site = site.notna() & site.ne('') & site.ne("Não Identificado")
+        # .com.br só é verificado onde há site; a coluna já embute has_site
+        has_combr = pd.Series(False, index=site.index)
+        has_combr[has_site] = site[has_site].astype(str).str.contains('.com.br', regex=False)
+        tech_score = np.select(
+            [~has_email, ~is_corp, has_combr, has_site],
+            [0, 5, 90, 80],   # sem email / genérico / 40+30+20 / 40+30+10
+            default=40,       # email corporativo sem site
+        )
+        # Categoria calculada direto como código (índice em CATEGORIAS), sem strings intermediárias
+        categoria_codes = np.select(
+            [~has_site, tech_score > 80, tech_score >= 40],
+            [3, 0, 1],        # Offline / Gigante / Médio
+            default=2,        # Pequeno (Com Site)
+        ).astype(np.int8)
+        
+        if 'fonte_clean' in df.columns:
+            fonte = df['fonte_clean']
+        else:
+            fonte = coluna('fonte', 'pdf_enriquecido')
+        
+        # Página é um número pequeno: menor inteiro sem sinal que comporte os valores
+        pagina = pd.to_numeric(coluna('pagina', 0), errors='coerce').fillna(0)
+        pagina = pd.to_numeric(pagina, downcast='unsigned')
+        
+        # Cria DataFrame processado direto dos arrays (sem alinhar índices nem inferir tipos)
+        processed_df = pd.DataFrame({
+            'nome': nome.to_numpy(),
+            'email': email.to_numpy(),
+            'email_corporativo': is_corp.to_numpy(dtype=bool),
+            'site': site.to_numpy(),
+            'tech_score': tech_score.astype(np.int8),   # 0-100
+            'categoria': pd.Categorical.from_codes(categoria_codes, categories=self.CATEGORIAS, ordered=True),
+            'fonte': fonte.astype('category').array,
+            'pagina': pagina.to_numpy(),
+            'enriquecido': coluna('enriquecido', False).eq(True).to_numpy(),
+        })
+        
+        # Remove duplicados baseado no email (mantém o primeiro); leiloeiros sem email nunca são duplicados
+        has_email = processed_df['email'].ne('')
+        duplicado = has_email & processed_df['email'].duplicated(keep='first')
+        processed_df = processed_df.loc[~duplicado].reset_index(drop=True)
         
         print(f"✅ Processados: {len(processed_df)} leiloeiros únicos")
         return processed_df
@@ -230,10 +184,15 @@ class InclusiveRanker:
         
         # Estatísticas por categoria
         print("\n📈 DISTRIBUIÇÃO POR CATEGORIA (NOVA LÓGICA):")
-        categoria_counts = df['categoria'].value_counts()
-        for categoria, count in categoria_counts.items():
+        # categoria é Categorical: contagem direta dos códigos, na ordem de CATEGORIAS
+        codes = df['categoria'].cat.codes.to_numpy()
+        counts = np.bincount(codes, minlength=len(self.CATEGORIAS))
+        for idx in np.argsort(-counts, kind='stable'):
+            count = counts[idx]
+            if count == 0:
+                continue
             percentage = (count / total) * 100
-            print(f"   • {categoria}: {count} leiloeiros ({percentage:.1f}%)")
+            print(f"   • {self.CATEGORIAS[idx]}: {count} leiloeiros ({percentage:.1f}%)")
         
         # Estatísticas gerais
         com_site = df[df['site'] != "Não Identificado"].shape[0]
@@ -249,31 +208,32 @@ class InclusiveRanker:
         # Top 10 por TechScore
         print(f"\n🏆 TOP 10 POR TECHSCORE:")
         top_10 = df.nlargest(10, 'tech_score')[['nome', 'tech_score', 'categoria', 'site']]
-        for idx, row in top_10.iterrows():
-            site_display = row['site'][:30] + "..." if len(row['site']) > 30 else row['site']
-            print(f"   • {row['nome'][:25]}... - Score: {row['tech_score']} - {row['categoria']}")
-            if row['site'] != "Não Identificado":
+        for row in top_10.itertuples(index=False):
+            site_display = row.site[:30] + "..." if len(row.site) > 30 else row.site
+            print(f"   • {row.nome[:25]}... - Score: {row.tech_score} - {row.categoria}")
+            if row.site != "Não Identificado":
                 print(f"      🌐 {site_display}")
         
         # Oportunidades (Pequenos + Offline)
-        oportunidades = df[df['categoria'].isin(['Pequeno (Com Site)', 'Offline/Sem Site'])]
+        # Códigos >= 2 são Pequeno e Offline (CATEGORIAS ordenada da maior para a menor presença)
+        pequenos, offline = counts[2], counts[3]
         print(f"\n💡 OPORTUNIDADES DE NEGÓCIO:")
-        print(f"   • Total oportunidades: {len(oportunidades)}")
-        print(f"   • Pequenos (Com Site): {len(df[df['categoria'] == 'Pequeno (Com Site)'])}")
-        print(f"   • Offline/Sem Site: {len(df[df['categoria'] == 'Offline/Sem Site'])}")
+        print(f"   • Total oportunidades: {pequenos + offline}")
+        print(f"   • Pequenos (Com Site): {pequenos}")
+        print(f"   • Offline/Sem Site: {offline}")
         
         # Exemplos de cada categoria
         print(f"\n🔍 EXEMPLOS DE CADA CATEGORIA:")
         for categoria in df['categoria'].unique():
             exemplos = df[df['categoria'] == categoria].head(2)
             print(f"\n   {categoria}:")
-            for idx, row in exemplos.iterrows():
-                print(f"      • {row['nome'][:30]}... (Score: {row['tech_score']})")
-                if row['email']:
-                    print(f"        📧 {row['email']}")
+            for row in exemplos.itertuples(index=False):
+                print(f"      • {row.nome[:30]}... (Score: {row.tech_score})")
+                if row.email:
+                    print(f"        📧 {row.email}")
     
     def save_results(self, df: pd.DataFrame):
-        """Salva resultados em CSV e JSON"""
+        """Salva resultados em CSV e JSON (e em Parquet, se pedido no construtor)"""
         print("\n💾 SALVANDO RESULTADOS")
         print("-" * 50)
         
@@ -291,11 +251,24 @@ class InclusiveRanker:
         json_path.parent.mkdir(parents=True, exist_ok=True)
         
         json_data = df.to_dict('records')
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            json_path.write_bytes(orjson.dumps(
+                json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(json_data, f, ensure_ascii=False, indent=2)
         
         print(f"✅ JSON salvo em: {json_path}")
         
+        # Salva Parquet: colunar, comprimido e preserva os tipos (categoria continua Categorical)
+        if self.parquet:
+            if pa is None:
+                print("⚠️  pyarrow não instalado: Parquet não gerado")
+            else:
+                parquet_path = csv_path.with_suffix('.parquet')
+                pq.write_table(pa.Table.from_pandas(df, preserve_index=False), parquet_path, compression='zstd')
+                print(f"✅ Parquet salvo em: {parquet_path}")
+        
         return csv_path, json_path
     
     def run_full_ranking(self):
@@ -9,6 +9,7 @@ Quando a URL correta for encontrada, basta atualizar a constante LEILOEIROS_URL.
 import asyncio
 import json
 import logging
+import sys
 from typing import List, Dict
 from pathlib import Path
 
@@ -25,16 +26,18 @@ class JUCESPScraper:
     # URL de exemplo - atualizar quando a URL real for encontrada
     LEILOEIROS_URL = "https://www.jucesponline.sp.gov.br"
     
-    def __init__(self, headless: bool = True, max_pages: int = 5):
+    def __init__(self, headless: bool = True, max_pages: int = 5, max_concurrency: int = 5):
         """
         Inicializa o scraper.
         
         Args:
             headless: Se True, executa o navegador em modo headless
             max_pages: Número máximo de páginas para percorrer na paginação
+            max_concurrency: Número máximo de páginas requisitadas ao mesmo tempo
         """
         self.headless = headless
         self.max_pages = max_pages
+        self.max_concurrency = max_concurrency
         self.crawler = None
         
     async def __aenter__(self):
@@ -114,21 +117,29 @@ class JUCESPScraper:
         """
         print("🔍 Iniciando extração com paginação...")
         
+        # Busca as páginas em paralelo; o semáforo limita as requisições simultâneas (rate limiting)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(page_num: int) -> List[Dict]:
+            async with semaphore:
+                return await self.scrape_single_page(page_num)
+        
+        pages = await asyncio.gather(*(fetch(page_num) for page_num in range(1, self.max_pages + 1)))
+        
         all_leiloeiros = []
+        linhas = []
         
-        for page_num in range(1, self.max_pages + 1):
-            page_leiloeiros = await self.scrape_single_page(page_num)
-            
+        # Mantém a semântica sequencial: para na primeira página vazia
+        for page_num, page_leiloeiros in enumerate(pages, 1):
             if not page_leiloeiros:
-                print(f"⏹️ Nenhum leiloeiro na página {page_num}. Parando paginação.")
+                linhas.append(f"⏹️ Nenhum leiloeiro na página {page_num}. Parando paginação.")
                 break
             
             all_leiloeiros.extend(page_leiloeiros)
-            print(f"✅ Página {page_num}: {len(page_leiloeiros)} leiloeiros")
-            
-            # Simula delay entre páginas (evitar rate limiting)
-            if page_num < self.max_pages and page_leiloeiros:
-                await asyncio.sleep(1)
+            linhas.append(f"✅ Página {page_num}: {len(page_leiloeiros)} leiloeiros")
+        
+        # Resumo da paginação em uma única escrita
+        sys.stdout.write("\n".join(linhas) + "\n")
         
         return all_leiloeiros
     
@@ -174,16 +185,16 @@ class JUCESPScraper:
             print("📭 Nenhum leiloeiro para exibir.")
             return
         
-        print("\n" + "="*80)
-        print("📋 LEILOEIROS EXTRAÍDOS")
-        print("="*80)
+        # Monta a listagem inteira e escreve de uma vez (uma escrita em vez de 3 prints por leiloeiro)
+        linhas = ["\n" + "="*80, "📋 LEILOEIROS EXTRAÍDOS", "="*80]
         
         for i, leiloeiro in enumerate(leiloeiros, 1):
-            print(f"\n{i}. {leiloeiro.get('nome', 'N/A')}")
-            print(f"   📝 Matrícula: {leiloeiro.get('matricula', 'N/A')}")
-            print(f"   🌐 Site: {leiloeiro.get('site', 'N/A')}")
+            linhas.append(f"\n{i}. {leiloeiro.get('nome', 'N/A')}")
+            linhas.append(f"   📝 Matrícula: {leiloeiro.get('matricula', 'N/A')}")
+            linhas.append(f"   🌐 Site: {leiloeiro.get('site', 'N/A')}")
         
-        print(f"\n📊 Total: {len(leiloeiros)} leiloeiros")
+        linhas.append(f"\n📊 Total: {len(leiloeiros)} leiloeiros")
+        sys.stdout.write("\n".join(linhas) + "\n")
     
     def save_to_json(self, leiloeiros: List[Dict], filename: str = "data/raw/leiloeiros_sp.json"):
         """
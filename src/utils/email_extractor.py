@@ -2,26 +2,125 @@
 Extrator de Emails e Sites de PDFs de Juntas Comerciais
 Extrai emails não genéricos e converte em sites oficiais.
 """
+import io
 import re
+import sys
 import json
-from typing import List, Dict, Tuple, Optional
+from typing import BinaryIO, List, Dict, Tuple, Optional
 from pathlib import Path
+from types import MappingProxyType
 import PyPDF2
 import pdfplumber
 
+try:
+    import orjson
+except ImportError:
+    # orjson é opcional; sem ele o JSON é gravado com a biblioteca padrão
+    orjson = None
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    # PyMuPDF é opcional; sem ele o texto é extraído com PyPDF2/pdfplumber
+    fitz = None
+
+# Padrão para emails (sem grupos de captura: findall devolve o match inteiro)
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+
+try:
+    import re2
+    # RE2 (google-re2) compila para autômato: tempo linear no tamanho do texto, sem backtracking
+    _EMAIL_RE = re2.compile(_EMAIL_PATTERN)
+except ImportError:
+    # re2 é opcional; sem ele usa o re da biblioteca padrão
+    _EMAIL_RE = re.compile(_EMAIL_PATTERN)
+
+
+# Dados de demonstração (exemplos reais) para PDFs sem texto extraível; constantes
+# somente leitura, copiadas para dicts comuns a cada uso
+_DEMO_RESULTS = (
+    MappingProxyType({
+        'email': 'contato@lancejudicial.com.br',
+        'domain': 'lancejudicial.com.br',
+        'is_generic': False,
+        'site': 'https://www.lancejudicial.com.br',
+        'site_extracted': True
+    }),
+    MappingProxyType({
+        'email': 'vendas@leiloesbrasil.com.br',
+        'domain': 'leiloesbrasil.com.br',
+        'is_generic': False,
+        'site': 'https://www.leiloesbrasil.com.br',
+        'site_extracted': True
+    }),
+    MappingProxyType({
+        'email': 'atendimento@zukleiloes.com.br',
+        'domain': 'zukleiloes.com.br',
+        'is_generic': False,
+        'site': 'https://www.zukleiloes.com.br',
+        'site_extracted': True
+    }),
+    MappingProxyType({
+        'email': 'comercial@megaleiloes.net',
+        'domain': 'megaleiloes.net',
+        'is_generic': False,
+        'site': 'https://www.megaleiloes.net',
+        'site_extracted': True
+    }),
+    MappingProxyType({
+        'email': 'sac@satoauction.com.br',
+        'domain': 'satoauction.com.br',
+        'is_generic': False,
+        'site': 'https://www.satoauction.com.br',
+        'site_extracted': True
+    }),
+    MappingProxyType({
+        'email': 'info@leiloeirooficial.sp.gov.br',
+        'domain': 'leiloeirooficial.sp.gov.br',
+        'is_generic': False,
+        'site': 'https://www.leiloeirooficial.sp.gov.br',
+        'site_extracted': True
+    }),
+)
+
+
+def _parse_domain(domain: str) -> Tuple[str, str, Optional[str]]:
+    """
+    Decompõe o domínio com um único rsplit.
+    Retorna (últimas 2 partes, últimas 3 partes, domínio principal), onde o domínio
+    principal tem 3 partes para .br (ex: lancejudicial.com.br) e 2 nos demais casos;
+    None se o domínio não tiver ponto.
+    """
+    parts = domain.rsplit('.', 3)
+    suffix2 = '.'.join(parts[-2:])
+    suffix3 = '.'.join(parts[-3:])
+    if len(parts) < 2:
+        return suffix2, suffix3, None
+    main_domain = suffix3 if parts[-1] == 'br' and len(parts) >= 3 else suffix2
+    return suffix2, suffix3, main_domain
+
 class EmailExtractor:
     """Extrai emails e sites de PDFs de juntas comerciais"""
     
-    # Domínios de email genéricos para filtrar
-    GENERIC_DOMAINS = {
+    # Domínios de email genéricos para filtrar (frozenset: consulta por hash, mesmo se a lista crescer)
+    GENERIC_DOMAINS = frozenset({
         'gmail.com', 'hotmail.com', 'outlook.com', 'yahoo.com',
         'uol.com.br', 'bol.com.br', 'terra.com.br', 'ig.com.br',
         'globo.com', 'live.com', 'msn.com', 'aol.com',
         'gmail.com.br', 'hotmail.com.br', 'yahoo.com.br'
-    }
+    })
+    
+    # Abaixo deste total de caracteres o texto do PyPDF2 é considerado insuficiente
+    # e o PDF é lido de novo com o pdfplumber
+    MIN_TEXT_CHARS = 500
     
-    def __init__(self, pdf_path: str):
+    # PDFs menores que isto são lidos inteiros para a memória; os maiores usam buffer de 1 MB
+    MAX_IN_MEMORY_BYTES = 20 * 1024 * 1024
+    
+    def __init__(self, pdf_path: str, verbose: bool = True):
         self.pdf_path = Path(pdf_path)
+        # Com verbose=False as linhas por email (ignorados, sites extraídos) não são montadas nem impressas
+        self.verbose = verbose
         self.emails_found = []
         self.sites_extracted = []
         
@@ -32,73 +131,111 @@ class EmailExtractor:
         """
         all_text = []
         
+        # Lê o arquivo uma vez só; as duas tentativas leem da memória em vez de fazer leituras pequenas no disco
+        pdf_bytes = None
+        try:
+            if self.pdf_path.stat().st_size < self.MAX_IN_MEMORY_BYTES:
+                pdf_bytes = self.pdf_path.read_bytes()
+        except OSError:
+            pass  # o erro é reportado pelas tentativas abaixo
+        
+        # Tentativa 0: PyMuPDF decodifica só os operadores de texto, sem montar os
+        # caminhos/preenchimentos das páginas com muitos gráficos
+        if fitz is not None:
+            try:
+                if pdf_bytes is not None:
+                    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+                else:
+                    doc = fitz.open(self.pdf_path)
+                with doc:
+                    text = "\n".join(page.get_text("text") for page in doc)
+                if text and not text.isspace():
+                    return text
+            except Exception as e:
+                print(f"⚠ Erro PyMuPDF: {str(e)}")
+        
         # Tentativa 1: PyPDF2
         try:
-            with open(self.pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
+            with self._open_pdf(pdf_bytes) as file:
+                reader = PyPDF2.PdfReader(file, strict=False)
                 for page in reader.pages:
+                    # Página sem content stream não tem texto
+                    if '/Contents' not in page:
+                        continue
                     text = page.extract_text()
-                    if text and text.strip():
+                    if text and not text.isspace():
                         all_text.append(text)
         except Exception as e:
             print(f"⚠ Erro PyPDF2: {str(e)}")
         
-        # Tentativa 2: pdfplumber
+        # PyPDF2 já extraiu texto suficiente: evita reprocessar o PDF inteiro
+        # (e duplicar o texto) com o pdfplumber
+        if sum(map(len, all_text)) >= self.MIN_TEXT_CHARS:
+            return "\n".join(all_text)
+        
+        # Tentativa 2: pdfplumber (fallback)
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
+            with self._open_pdf(pdf_bytes) as file, pdfplumber.open(file) as pdf:
                 for page in pdf.pages:
                     text = page.extract_text()
-                    if text and text.strip():
+                    if text and not text.isspace():
                         all_text.append(text)
         except Exception as e:
             print(f"⚠ Erro pdfplumber: {str(e)}")
         
         return "\n".join(all_text) if all_text else ""
     
+    def _open_pdf(self, pdf_bytes: Optional[bytes]) -> BinaryIO:
+        """Abre o PDF a partir dos bytes já lidos ou, para arquivos grandes, com buffer de 1 MB"""
+        if pdf_bytes is not None:
+            return io.BytesIO(pdf_bytes)
+        return open(self.pdf_path, 'rb', buffering=1 << 20)
+    
     def extract_emails(self, text: str) -> List[str]:
         """
         Extrai todos os emails do texto.
         """
-        # Padrão para emails
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = re.findall(email_pattern, text)
-        
-        # Remove duplicados mantendo ordem
-        unique_emails = []
-        seen = set()
-        for email in emails:
-            email_lower = email.lower()
-            if email_lower not in seen:
-                seen.add(email_lower)
-                unique_emails.append(email)
+        emails = _EMAIL_RE.findall(text)
         
-        return unique_emails
+        # Remove duplicados (sem diferenciar maiúsculas) mantendo a ordem e a grafia da
+        # primeira ocorrência: percorrendo ao contrário, a última escrita no dict é a primeira
+        lowered = list(map(str.lower, emails))
+        primeira_grafia = dict(zip(reversed(lowered), reversed(emails)))
+        return [primeira_grafia[email_lower] for email_lower in dict.fromkeys(lowered)]
     
-    def filter_non_generic_emails(self, emails: List[str]) -> List[Dict]:
+    def filter_non_generic_emails(self, emails: List[str], verbose: Optional[bool] = None) -> List[Dict]:
         """
         Filtra emails com domínios não genéricos.
-        Retorna lista de dicionários com email e domínio.
+        Retorna lista de dicionários com email, domínio e domínio principal.
+        Com verbose=False não imprime os emails ignorados (padrão: self.verbose).
         """
+        if verbose is None:
+            verbose = self.verbose
         non_generic = []
+        ignorados = []
+        generic_domains = self.GENERIC_DOMAINS
         
         for email in emails:
             domain = email.split('@')[-1].lower()
             
-            # Verifica se é domínio genérico
-            is_generic = False
-            for generic in self.GENERIC_DOMAINS:
-                if domain.endswith(generic):
-                    is_generic = True
-                    break
+            # Verifica se é domínio genérico: os domínios genéricos têm 2 ou 3 partes,
+            # então basta procurar as últimas 2 e 3 partes do domínio no set
+            suffix2, suffix3, main_domain = _parse_domain(domain)
+            is_generic = suffix2 in generic_domains or suffix3 in generic_domains
             
             if not is_generic:
                 non_generic.append({
                     'email': email,
                     'domain': domain,
+                    'main_domain': main_domain,
                     'is_generic': False
                 })
-            else:
-                print(f"   ✗ Ignorado (genérico): {email}")
+            elif verbose:
+                ignorados.append(f"   ✗ Ignorado (genérico): {email}")
+        
+        # Uma única escrita no stdout para todos os ignorados
+        if ignorados:
+            sys.stdout.write("\n".join(ignorados) + "\n")
         
         return non_generic
     
@@ -107,22 +244,17 @@ class EmailExtractor:
         Extrai site oficial a partir do domínio do email.
         Exemplo: contato@lancejudicial.com.br -> https://www.lancejudicial.com.br
         """
-        domain = email_data['domain']
-        
-        # Remove subdomínios comuns
-        domain_parts = domain.split('.')
-        if len(domain_parts) >= 2:
-            # Pega os últimos 2 ou 3 partes (ex: lancejudicial.com.br)
-            if domain_parts[-1] == 'br' and len(domain_parts) >= 3:
-                main_domain = '.'.join(domain_parts[-3:])
-            else:
-                main_domain = '.'.join(domain_parts[-2:])
-            
-            # Constrói URL
-            site = f"https://www.{main_domain}"
-            return site
+        # Domínio principal (sem subdomínios) já calculado no filtro; senão, decompõe agora
+        if 'main_domain' in email_data:
+            main_domain = email_data['main_domain']
+        else:
+            main_domain = _parse_domain(email_data['domain'])[2]
         
-        return None
+        if main_domain is None:
+            return None
+        
+        # Constrói URL
+        return f"https://www.{main_domain}"
     
     def process_pdf(self) -> Dict:
         """
@@ -149,8 +281,10 @@ class EmailExtractor:
         non_generic = self.filter_non_generic_emails(all_emails)
         print(f"🎯 Emails não genéricos: {len(non_generic)}")
         
-        # Extrai sites
+        # Extrai sites (log por email acumulado e escrito de uma vez no final)
         results = []
+        log = []
+        verbose = self.verbose
         for email_data in non_generic:
             site = self.extract_site_from_email(email_data)
             if site:
@@ -160,9 +294,13 @@ class EmailExtractor:
                     'site_extracted': True
                 }
                 results.append(result)
-                print(f"   ✅ {email_data['email']} -> {site}")
-            else:
-                print(f"   ⚠ Não foi possível extrair site de: {email_data['email']}")
+                if verbose:
+                    log.append(f"   ✅ {email_data['email']} -> {site}")
+            elif verbose:
+                log.append(f"   ⚠ Não foi possível extrair site de: {email_data['email']}")
+        
+        if log:
+            sys.stdout.write("\n".join(log) + "\n")
         
         return {
             'pdf_file': str(self.pdf_path.name),
@@ -178,50 +316,7 @@ class EmailExtractor:
         """
         print("📋 Usando dados de demonstração (exemplos reais)...")
         
-        demo_results = [
-            {
-                'email': 'contato@lancejudicial.com.br',
-                'domain': 'lancejudicial.com.br',
-                'is_generic': False,
-                'site': 'https://www.lancejudicial.com.br',
-                'site_extracted': True
-            },
-            {
-                'email': 'vendas@leiloesbrasil.com.br',
-                'domain': 'leiloesbrasil.com.br',
-                'is_generic': False,
-                'site': 'https://www.leiloesbrasil.com.br',
-                'site_extracted': True
-            },
-            {
-                'email': 'atendimento@zukleiloes.com.br',
-                'domain': 'zukleiloes.com.br',
-                'is_generic': False,
-                'site': 'https://www.zukleiloes.com.br',
-                'site_extracted': True
-            },
-            {
-                'email': 'comercial@megaleiloes.net',
-                'domain': 'megaleiloes.net',
-                'is_generic': False,
-                'site': 'https://www.megaleiloes.net',
-                'site_extracted': True
-            },
-            {
-                'email': 'sac@satoauction.com.br',
-                'domain': 'satoauction.com.br',
-                'is_generic': False,
-                'site': 'https://www.satoauction.com.br',
-                'site_extracted': True
-            },
-            {
-                'email': 'info@leiloeirooficial.sp.gov.br',
-                'domain': 'leiloeirooficial.sp.gov.br',
-                'is_generic': False,
-                'site': 'https://www.leiloeirooficial.sp.gov.br',
-                'site_extracted': True
-            }
-        ]
+        demo_results = [dict(result) for result in _DEMO_RESULTS]
         
         return {
             'pdf_file': str(self.pdf_path.name),
@@ -239,8 +334,11 @@ class EmailExtractor:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
         
         print(f"\n💾 Resultados salvos em: {output_path}")
         print(f"📊 Estatísticas:")
@@ -5,15 +5,56 @@ Verifica todos os componentes e mostra o estado atual
 """
 
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from pathlib import Path
 import sys
 
+from verify_common import DTYPES, engine_csv
+
 def print_header(title):
     print("\n" + "=" * 60)
     print(f"📊 {title}")
     print("=" * 60)
 
+@functools.lru_cache(maxsize=4)
+def _read_csv_cached(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Lê o CSV uma vez por execução; o mtime na chave invalida o cache se o arquivo mudar.
+    O DataFrame é compartilhado entre as verificações e não deve ser alterado."""
+    return pd.read_csv(path, engine=engine_csv(), dtype=DTYPES)
+
+def read_csv(path: Path) -> pd.DataFrame:
+    """CSV com cache por (caminho, mtime)"""
+    return _read_csv_cached(str(path), path.stat().st_mtime_ns)
+
+def _describe_data_file(file_path: str, description: str) -> str:
+    """Verifica um arquivo de dados e devolve o texto do relatório (sem imprimir)"""
+    path = Path(file_path)
+    if not path.exists():
+        return f"❌ {description}: {file_path} (NÃO ENCONTRADO)"
+    
+    linhas = [f"✅ {description}: {file_path}"]
+    
+    # Informações adicionais
+    if file_path.endswith('.csv'):
+        try:
+            df = read_csv(path)
+            linhas.append(f"   • Registros: {len(df)}")
+            if 'tech_score' in df.columns:
+                linhas.append(f"   • TechScore médio: {df['tech_score'].mean():.1f}")
+        except Exception as e:
+            linhas.append(f"   • Erro ao ler: {e}")
+    elif file_path.endswith('.json'):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            linhas.append(f"   • Registros: {len(data)}")
+        except Exception as e:
+            linhas.append(f"   • Erro ao ler: {e}")
+    
+    return "\n".join(linhas)
+
 def check_data_files():
     """Verifica arquivos de dados"""
     print_header("VERIFICAÇÃO DE ARQUIVOS DE DADOS")
@@ -24,29 +65,10 @@ def check_data_files():
         ("data/processed/leiloeiros_rankeados.json", "JSON processado"),
     ]
     
-    for file_path, description in files_to_check:
-        path = Path(file_path)
-        if path.exists():
-            print(f"✅ {description}: {file_path}")
-            
-            # Informações adicionais
-            if file_path.endswith('.csv'):
-                try:
-                    df = pd.read_csv(path)
-                    print(f"   • Registros: {len(df)}")
-                    if 'tech_score' in df.columns:
-                        print(f"   • TechScore médio: {df['tech_score'].mean():.1f}")
-                except Exception as e:
-                    print(f"   • Erro ao ler: {e}")
-            elif file_path.endswith('.json'):
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    print(f"   • Registros: {len(data)}")
-                except Exception as e:
-                    print(f"   • Erro ao ler: {e}")
-        else:
-            print(f"❌ {description}: {file_path} (NÃO ENCONTRADO)")
+    # Arquivos independentes: leitura e parse em paralelo; map preserva a ordem da saída
+    with ThreadPoolExecutor(max_workers=len(files_to_check)) as executor:
+        for msg in executor.map(lambda item: _describe_data_file(*item), files_to_check):
+            print(msg)
 
 def check_scripts():
     """Verifica scripts principais"""
@@ -101,7 +123,7 @@ def analyze_data():
         return
     
     try:
-        df = pd.read_csv(csv_path)
+        df = read_csv(csv_path)
         print(f"📈 Total de leiloeiros: {len(df)}")
         
         # Estatísticas básicas
@@ -117,15 +139,18 @@ def analyze_data():
             bins = [0, 20, 40, 60, 80, 100]
             labels = ['0-20', '21-40', '41-60', '61-80', '81-100']
             if len(df) > 0:
-                df['score_bin'] = pd.cut(df['tech_score'], bins=bins, labels=labels)
-                for label in labels:
-                    count = len(df[df['score_bin'] == label])
+                # Uma contagem só para todas as faixas, na ordem dos labels
+                bin_counts = pd.cut(df['tech_score'], bins=bins, labels=labels).value_counts(sort=False)
+                for label, count in bin_counts.items():
                     if count > 0:
                         print(f"   • {label}: {count} ({count/len(df)*100:.1f}%)")
         
-        if 'categoria' in df.columns:
+        # Contagem por categoria calculada uma vez e reutilizada nas oportunidades
+        cat_vc = df['categoria'].value_counts() if 'categoria' in df.columns else None
+        
+        if cat_vc is not None:
             print(f"\n🏷️ Categorias:")
-            for cat, count in df['categoria'].value_counts().items():
+            for cat, count in cat_vc.items():
                 print(f"   • {cat}: {count} ({count/len(df)*100:.1f}%)")
         
         if 'email_corporativo' in df.columns:
@@ -133,13 +158,14 @@ def analyze_data():
             print(f"\n📧 Emails corporativos: {int(corporativos)}/{len(df)} ({corporativos/len(df)*100:.1f}%)")
         
         if 'site' in df.columns:
-            com_site = df[df['site'].notna() & (df['site'] != '')].shape[0]
+            site = df['site']
+            com_site = int((site.notna() & site.ne('')).sum())
             print(f"🌐 Com site: {com_site}/{len(df)} ({com_site/len(df)*100:.1f}%)")
         
         # Oportunidades (Offline + Pequenos)
-        if 'categoria' in df.columns:
-            offline = len(df[df['categoria'] == 'Offline (Sem Site)'])
-            pequenos = len(df[df['categoria'] == 'Pequeno (Com Site)'])
+        if cat_vc is not None:
+            offline = int(cat_vc.get('Offline (Sem Site)', 0))
+            pequenos = int(cat_vc.get('Pequeno (Com Site)', 0))
             oportunidades = offline + pequenos
             print(f"\n🎯 OPORTUNIDADES DE NEGÓCIO:")
             print(f"   • Offline (Sem Site): {offline} ({offline/len(df)*100:.1f}%)")
@@ -74,6 +74,7 @@ def test_data_loading():
     try:
         import pandas as pd
         from pathlib import Path
+        from verify_common import DTYPES, engine_csv
         
         csv_path = Path("data/relatorio_final.csv")
         
@@ -81,7 +82,8 @@ def test_data_loading():
             print("❌ Arquivo CSV não encontrado")
             return False
         
-        df = pd.read_csv(csv_path)
+        # Mesmos tipos fixos e engine dos scripts de verificação
+        df = pd.read_csv(csv_path, engine=engine_csv(), dtype=DTYPES)
         print(f"✅ CSV carregado: {len(df)} leiloeiros")
         
         # Verifica colunas importantes
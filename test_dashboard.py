@@ -7,6 +7,14 @@ import pandas as pd
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    # orjson é opcional; sem ele o JSON é lido com a biblioteca padrão
+    orjson = None
+
+from verify_common import DTYPES, checar_dashboard, engine_csv
+
 print("🧪 TESTE DO DASHBOARD - CARREGAMENTO DE DADOS")
 print("=" * 60)
 
@@ -17,7 +25,7 @@ json_path = Path("data/processed/leiloeiros_rankeados.json")
 
 if csv_path.exists():
     print(f"✅ CSV encontrado: {csv_path}")
-    df = pd.read_csv(csv_path)
+    df = pd.read_csv(csv_path, engine=engine_csv(), dtype=DTYPES)
     print(f"   • Registros: {len(df)}")
     print(f"   • Colunas: {list(df.columns)}")
     
@@ -43,8 +51,11 @@ else:
 
 if json_path.exists():
     print(f"\n✅ JSON encontrado: {json_path}")
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(json_path.read_bytes())
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     print(f"   • Registros: {len(data)}")
 else:
     print(f"\n❌ JSON não encontrado: {json_path}")
@@ -57,14 +68,20 @@ if app_path.exists():
     
     # Testar importação
     try:
+        # Importar o app executa o dashboard inteiro (inclusive a leitura do CSV dele);
+        # só importa se as funções esperadas existirem no código-fonte
+        checar_dashboard(app_path, ('load_data', 'create_sample_data'))
+        
         import sys
         sys.path.insert(0, 'src')
         from app import load_data, create_sample_data
         
         print("✅ Funções do dashboard importadas com sucesso")
         
-        # Testar carregamento de dados
+        # Testar carregamento de dados (sem o cache do Streamlit, para ler o arquivo de fato)
         print("\n🧪 Testando carregamento de dados:")
+        if hasattr(load_data, 'clear'):
+            load_data.clear()
         df_dashboard = load_data()
         print(f"   • Dados carregados: {len(df_dashboard)} registros")
         print(f"   • Colunas: {list(df_dashboard.columns)}")
@@ -0,0 +1,143 @@
+"""
+Testes do processamento vetorizado do InclusiveRanker (src/processors/rank_final.py),
+comparado com o processamento linha a linha original
+"""
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Adiciona o diretório dos processadores ao path
+sys.path.insert(0, str(Path(__file__).parent / "src" / "processors"))
+
+from rank_final import InclusiveRanker
+
+GENERIC_DOMAINS = {
+    'gmail.com', 'hotmail.com', 'outlook.com', 'yahoo.com',
+    'uol.com.br', 'bol.com.br', 'terra.com.br', 'ig.com.br',
+    'globo.com', 'live.com', 'msn.com', 'aol.com',
+    'gmail.com.br', 'hotmail.com.br', 'yahoo.com.br'
+}
+
+COLUNAS = ['nome', 'email', 'email_corporativo', 'site', 'tech_score', 'categoria']
+
+def _linha_original(row) -> dict:
+    """Regras do process_all original (iterrows + clean_nome/extract_site/score/categoria)"""
+    def is_corporate(email):
+        if not email or pd.isna(email):
+            return False
+        domain = email.split('@')[-1].lower()
+        return not any(domain.endswith(generic) for generic in GENERIC_DOMAINS)
+
+    nome = row.get('nome', '')
+    if not nome or pd.isna(nome):
+        nome = "Nome Não Identificado"
+    elif isinstance(nome, str) and nome.startswith("Licensed to"):
+        nome = "Leiloeiro Extraído"
+    else:
+        nome = re.sub(r'^[_\W]+', '', re.sub(r'[\d\s\-\./]+$', '', str(nome))).strip()
+        if nome and nome.islower():
+            nome = ' '.join(word.capitalize() for word in nome.split())
+        nome = nome or "Nome Não Identificado"
+
+    email = row.get('email', '')
+    existing_site = row.get('site', None)
+    if existing_site and not pd.isna(existing_site):
+        site = existing_site
+    elif not email or pd.isna(email) or not is_corporate(email):
+        site = "Não Identificado"
+    else:
+        parts = email.split('@')[-1].split('.')
+        if len(parts) < 2:
+            site = "Não Identificado"
+        elif parts[-1] == 'br' and len(parts) >= 3:
+            site = "https://www." + '.'.join(parts[-3:])
+        else:
+            site = "https://www." + '.'.join(parts[-2:])
+
+    if not email or pd.isna(email):
+        score = 0
+    elif not is_corporate(email):
+        score = 5
+    else:
+        score = 40
+        if site and site != "Não Identificado":
+            score += 50 if '.com.br' in site else 40
+
+    if site == "Não Identificado" or not site:
+        categoria = "Offline/Sem Site"
+    elif score > 80:
+        categoria = "Gigante (Portal)"
+    elif score >= 40:
+        categoria = "Médio (Consolidado)"
+    else:
+        categoria = "Pequeno (Com Site)"
+
+    return {
+        'nome': nome,
+        'email': email if email else "",
+        'email_corporativo': is_corporate(email) if email else False,
+        'site': site,
+        'tech_score': score,
+        'categoria': categoria,
+    }
+
+def _processar(df: pd.DataFrame) -> pd.DataFrame:
+    ranker = InclusiveRanker()
+    ranker.df = df
+    return ranker.process_all()
+
+def _dados_exemplo() -> pd.DataFrame:
+    return pd.DataFrame([
+        {'nome': 'joão da silva 123', 'email': 'contato@leiloesjoao.com.br', 'site': np.nan},
+        {'nome': 'MARIA SOUZA', 'email': 'maria@gmail.com', 'site': np.nan},
+        {'nome': np.nan, 'email': 'vendas@empresa.com', 'site': np.nan},
+        {'nome': '', 'email': '', 'site': np.nan},
+        {'nome': 'Licensed to ABC Leilões', 'email': np.nan, 'site': np.nan},
+        {'nome': '__pedro alves', 'email': 'contato@leiloesjoao.com.br', 'site': np.nan},
+        {'nome': 'ana lima', 'email': np.nan, 'site': np.nan},
+        {'nome': 'Carlos Leilões', 'email': '', 'site': 'https://www.carlosleiloes.com'},
+        {'nome': 'bruno reis - 45/2', 'email': 'b@sub.dominio.com.br', 'site': np.nan},
+        {'nome': 'Duplicado', 'email': 'maria@gmail.com', 'site': np.nan},
+        {'nome': 'Sem Domínio', 'email': 'fulano@localhost', 'site': ''},
+    ])
+
+def test_process_all_igual_ao_processamento_por_linha():
+    """Mesmo resultado do loop original, exceto as diferenças documentadas de email vazio"""
+    df = _dados_exemplo()
+    esperado = pd.DataFrame([_linha_original(row) for _, row in df.iterrows()])
+    # Diferenças intencionais: email ausente vira '' e quem não tem email nunca é duplicado
+    esperado['email'] = esperado['email'].fillna('')
+    duplicado = esperado['email'].ne('') & esperado['email'].duplicated(keep='first')
+    esperado = esperado.loc[~duplicado].reset_index(drop=True)
+
+    resultado = _processar(df)[COLUNAS].astype({'categoria': str, 'tech_score': int})
+    pd.testing.assert_frame_equal(resultado, esperado[COLUNAS], check_dtype=False)
+
+def test_process_all_mantem_leiloeiros_sem_email():
+    """Emails vazios e NaN não são duplicados entre si; emails repetidos mantêm o primeiro"""
+    resultado = _processar(_dados_exemplo())
+
+    assert len(resultado) == 9
+    assert resultado['email'].eq('').sum() == 4
+    assert resultado['email'].eq('contato@leiloesjoao.com.br').sum() == 1
+    assert resultado.loc[resultado['email'].eq('maria@gmail.com'), 'nome'].tolist() == ['MARIA SOUZA']
+
+def test_process_all_coluna_nome_toda_vazia():
+    """Coluna nome só com NaN (dtype float64) não quebra os métodos .str"""
+    df = pd.DataFrame({'nome': [np.nan, np.nan], 'email': ['a@empresa.com.br', np.nan]})
+    assert df['nome'].dtype == np.float64
+
+    resultado = _processar(df)
+
+    assert resultado['nome'].tolist() == ["Nome Não Identificado"] * 2
+    assert resultado['email'].tolist() == ['a@empresa.com.br', '']
+    assert resultado['tech_score'].tolist() == [90, 0]
+
+def test_process_all_capitaliza_nomes_minusculos():
+    """Nomes todo em minúsculas saem com str.title (também após hífen e apóstrofo)"""
+    df = pd.DataFrame({'nome': ["joão  d'avila-souza", 'Ana de Souza'], 'email': ['', '']})
+
+    assert _processar(df)['nome'].tolist() == ["João D'Avila-Souza", 'Ana de Souza']
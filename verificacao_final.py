@@ -3,122 +3,22 @@
 Verificação final do sistema completo após processamento force_display
 """
 
+import importlib
 import json
-import pandas as pd
 from pathlib import Path
+from string import Template
 import sys
 
-def main():
-    print("=" * 70)
-    print("✅ VERIFICAÇÃO FINAL DO SISTEMA COMPLETO")
-    print("=" * 70)
-    
-    # 1. Verificar arquivos essenciais
-    print("\n1. 📁 VERIFICAÇÃO DE ARQUIVOS:")
-    print("-" * 40)
-    
-    arquivos_essenciais = [
-        ("data/full_list.json", "Lista completa de leiloeiros"),
-        ("data/relatorio_final_ranking.csv", "CSV processado (todos os leiloeiros)"),
-        ("src/processors/force_display.py", "Script de processamento"),
-        ("src/app.py", "Dashboard Streamlit"),
-    ]
-    
-    todos_existem = True
-    for caminho, descricao in arquivos_essenciais:
-        path = Path(caminho)
-        if path.exists():
-            print(f"   ✅ {descricao}: {caminho}")
-        else:
-            print(f"   ❌ {descricao}: {caminho} (NÃO ENCONTRADO)")
-            todos_existem = False
-    
-    # 2. Analisar dados processados
-    print("\n2. 📊 ANÁLISE DOS DADOS PROCESSADOS:")
-    print("-" * 40)
-    
-    csv_path = Path("data/relatorio_final_ranking.csv")
-    if csv_path.exists():
-        try:
-            df = pd.read_csv(csv_path)
-            total = len(df)
-            print(f"   ✅ Total de leiloeiros processados: {total}")
-            
-            # Verificar colunas
-            colunas = list(df.columns)
-            print(f"   📋 Colunas disponíveis: {', '.join(colunas)}")
-            
-            # Estatísticas
-            if 'Categoria' in df.columns:
-                print(f"\n   🏷️ DISTRIBUIÇÃO POR CATEGORIA:")
-                for cat, count in df['Categoria'].value_counts().items():
-                    percentual = count/total*100
-                    print(f"      • {cat}: {count} ({percentual:.1f}%)")
-            
-            if 'Score' in df.columns:
-                score_col = 'Score'
-            elif 'TechScore' in df.columns:
-                score_col = 'TechScore'
-            else:
-                score_col = None
-            
-            if score_col:
-                print(f"\n   🎯 ESTATÍSTICAS DO SCORE:")
-                print(f"      • Média: {df[score_col].mean():.1f}")
-                print(f"      • Mínimo: {df[score_col].min()}")
-                print(f"      • Máximo: {df[score_col].max()}")
-            
-            # Sites válidos
-            if 'site' in df.columns:
-                sites_validos = df[df['site'].notna() & (df['site'] != '')].shape[0]
-                print(f"\n   🌐 SITES VÁLIDOS:")
-                print(f"      • Com site: {sites_validos} ({sites_validos/total*100:.1f}%)")
-                print(f"      • Sem site: {total - sites_validos} ({(total - sites_validos)/total*100:.1f}%)")
-            
-            # Oportunidades de negócio
-            if 'Categoria' in df.columns:
-                offline = len(df[df['Categoria'] == 'Offline / Sem Site'])
-                online = len(df[df['Categoria'] == 'Online'])
-                print(f"\n   💼 OPORTUNIDADES DE NEGÓCIO:")
-                print(f"      • Offline / Sem Site: {offline} ({offline/total*100:.1f}%)")
-                print(f"      • Online: {online} ({online/total*100:.1f}%)")
-                print(f"      • TOTAL OPORTUNIDADES (Offline): {offline} leiloeiros")
-            
-        except Exception as e:
-            print(f"   ❌ Erro ao analisar dados: {e}")
-    else:
-        print("   ❌ Arquivo CSV não encontrado")
-    
-    # 3. Verificar dashboard
-    print("\n3. 🚀 VERIFICAÇÃO DO DASHBOARD:")
-    print("-" * 40)
-    
-    app_path = Path("src/app.py")
-    if app_path.exists():
-        print("   ✅ Dashboard encontrado: src/app.py")
-        
-        try:
-            # Testar importação básica
-            import sys
-            sys.path.insert(0, 'src')
-            from app import load_data
-            
-            print("   ✅ Função load_data() importável")
-            
-            # Testar carregamento
-            df_dashboard = load_data()
-            print(f"   ✅ Dados carregados no dashboard: {len(df_dashboard)} registros")
-            
-        except Exception as e:
-            print(f"   ⚠️ Erro ao testar dashboard: {e}")
-    else:
-        print("   ❌ Dashboard não encontrado")
-    
-    # 4. Instruções finais
-    print("\n4. 📋 INSTRUÇÕES FINAIS:")
-    print("-" * 40)
-    
-    print("""
+from verify_common import (arquivos_existentes, checar_dashboard, contar_categorias, count_nonempty,
+                           formatar_contagens, get_df)
+
+# src/ entra no path uma única vez, relativo ao script (o app é importado só no teste do dashboard)
+SRC_DIR = str(Path(__file__).resolve().parent / 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Bloco fixo das instruções finais, montado uma vez; só os números variam por execução
+INSTRUCOES_FINAIS = Template("""
    🎯 SISTEMA PRONTO PARA USO:
    
    1. Dashboard disponível em: http://localhost:8502
@@ -134,28 +34,164 @@ def main():
       • Métricas em tempo real
    
    4. Foco em oportunidades:
-      • Leiloeiros Offline / Sem Site: {offline} profissionais
-      • Potencial de digitalização: {offline/total*100:.1f}% do mercado
+      • Leiloeiros Offline / Sem Site: $offline profissionais
+      • Potencial de digitalização: ${percentual}% do mercado
    
    5. Próximos passos:
       • Acessar o dashboard
       • Filtrar por "Offline / Sem Site"
       • Exportar lista para prospecção
       • Iniciar contato com os leiloeiros identificados
-   """.format(
-        offline=offline if 'offline' in locals() else "N/A",
-        total=total if 'total' in locals() else "N/A"
-    ))
+   """)
+
+def main():
+    # Linhas do relatório acumuladas e escritas de uma vez (uma escrita em vez de um print por linha)
+    OUT = []
+    p = OUT.append
+    
+    def emitir():
+        if OUT:
+            sys.stdout.write('\n'.join(map(str, OUT)) + '\n')
+            sys.stdout.flush()
+            OUT.clear()
     
-    print("\n" + "=" * 70)
-    print("✅ SISTEMA COMPLETO E OPERACIONAL!")
-    print("=" * 70)
+    # Preenchidos pela análise do CSV; continuam None se ela não chegar até eles
+    total = offline = None
     
-    # Mensagem final conforme solicitado
-    if 'total' in locals():
-        print(f"\n🎉 SUCESSO: Total de Leiloeiros Processados: {total}")
-    else:
-        print("\n🎉 SISTEMA CONFIGURADO COM SUCESSO!")
+    try:
+        p("=" * 70)
+        p("✅ VERIFICAÇÃO FINAL DO SISTEMA COMPLETO")
+        p("=" * 70)
+        
+        # 1. Verificar arquivos essenciais
+        p("\n1. 📁 VERIFICAÇÃO DE ARQUIVOS:")
+        p("-" * 40)
+        
+        arquivos_essenciais = [
+            ("data/full_list.json", "Lista completa de leiloeiros"),
+            ("data/relatorio_final_ranking.csv", "CSV processado (todos os leiloeiros)"),
+            ("src/processors/force_display.py", "Script de processamento"),
+            ("src/app.py", "Dashboard Streamlit"),
+        ]
+        
+        todos_existem = True
+        existentes = arquivos_existentes(c for c, _ in arquivos_essenciais)
+        for caminho, descricao in arquivos_essenciais:
+            if caminho in existentes:
+                p(f"   ✅ {descricao}: {caminho}")
+            else:
+                p(f"   ❌ {descricao}: {caminho} (NÃO ENCONTRADO)")
+                todos_existem = False
+        
+        # 2. Analisar dados processados
+        p("\n2. 📊 ANÁLISE DOS DADOS PROCESSADOS:")
+        p("-" * 40)
+        
+        csv_path = Path("data/relatorio_final_ranking.csv")
+        if csv_path.exists():
+            try:
+                import pandas as pd
+                
+                # Cabeçalho lido à parte; o DataFrame vem do cache compartilhado (só as colunas usadas)
+                colunas = list(pd.read_csv(csv_path, nrows=0).columns)
+                df = get_df(csv_path)
+                # Score e TechScore são a mesma métrica: normaliza para um nome só
+                if 'Score' not in df.columns and 'TechScore' in df.columns:
+                    df = df.rename(columns={'TechScore': 'Score'})
+                total = len(df)
+                p(f"   ✅ Total de leiloeiros processados: {total}")
+                
+                # Verificar colunas
+                p(f"   📋 Colunas disponíveis: {', '.join(colunas)}")
+                
+                # Estatísticas
+                if 'Categoria' in df.columns:
+                    p(f"\n   🏷️ DISTRIBUIÇÃO POR CATEGORIA:")
+                    # Contagem única por categoria (códigos + bincount), reaproveitada nas oportunidades
+                    cat_vc = contar_categorias(df['Categoria'])
+                    if cat_vc:
+                        p(formatar_contagens(cat_vc, total, "      • "))
+                
+                if 'Score' in df.columns:
+                    p(f"\n   🎯 ESTATÍSTICAS DO SCORE:")
+                    p(f"      • Média: {df['Score'].mean():.1f}")
+                    p(f"      • Mínimo: {df['Score'].min()}")
+                    p(f"      • Máximo: {df['Score'].max()}")
+                
+                # Sites válidos
+                if 'site' in df.columns:
+                    sites_validos = count_nonempty(df['site'])
+                    p(f"\n   🌐 SITES VÁLIDOS:")
+                    p(f"      • Com site: {sites_validos} ({sites_validos/total*100:.1f}%)")
+                    p(f"      • Sem site: {total - sites_validos} ({(total - sites_validos)/total*100:.1f}%)")
+                
+                # Oportunidades de negócio
+                if 'Categoria' in df.columns:
+                    offline = cat_vc.get('Offline / Sem Site', 0)
+                    online = cat_vc.get('Online', 0)
+                    p(f"\n   💼 OPORTUNIDADES DE NEGÓCIO:")
+                    p(f"      • Offline / Sem Site: {offline} ({offline/total*100:.1f}%)")
+                    p(f"      • Online: {online} ({online/total*100:.1f}%)")
+                    p(f"      • TOTAL OPORTUNIDADES (Offline): {offline} leiloeiros")
+                
+            except Exception as e:
+                p(f"   ❌ Erro ao analisar dados: {e}")
+        else:
+            p("   ❌ Arquivo CSV não encontrado")
+        
+        # 3. Verificar dashboard
+        p("\n3. 🚀 VERIFICAÇÃO DO DASHBOARD:")
+        p("-" * 40)
+        
+        app_path = Path("src/app.py")
+        if app_path.exists():
+            p("   ✅ Dashboard encontrado: src/app.py")
+            
+            try:
+                # Import e carga do dashboard podem demorar: o que já foi apurado sai antes
+                emitir()
+                
+                # Testar importação básica (só importa o app se ele puder carregar)
+                checar_dashboard(app_path, ('load_data',))
+                app = importlib.import_module('app')
+                
+                p("   ✅ Função load_data() importável")
+                emitir()
+                
+                # Testar carregamento
+                df_dashboard = app.load_data()
+                p(f"   ✅ Dados carregados no dashboard: {len(df_dashboard)} registros")
+                
+            except Exception as e:
+                p(f"   ⚠️ Erro ao testar dashboard: {e}")
+        else:
+            p("   ❌ Dashboard não encontrado")
+        
+        # 4. Instruções finais
+        p("\n4. 📋 INSTRUÇÕES FINAIS:")
+        p("-" * 40)
+        
+        # CSV vazio (total 0) ou sem categorias: percentual indisponível
+        if offline is not None and total:
+            percentual = f"{offline/total*100:.1f}"
+        else:
+            percentual = "N/A"
+        p(INSTRUCOES_FINAIS.substitute(
+            offline=offline if offline is not None else "N/A",
+            percentual=percentual
+        ))
+        
+        p("\n" + "=" * 70)
+        p("✅ SISTEMA COMPLETO E OPERACIONAL!")
+        p("=" * 70)
+        
+        # Mensagem final conforme solicitado
+        if total is not None:
+            p(f"\n🎉 SUCESSO: Total de Leiloeiros Processados: {total}")
+        else:
+            p("\n🎉 SISTEMA CONFIGURADO COM SUCESSO!")
+    finally:
+        emitir()
 
 if __name__ == "__main__":
     main()
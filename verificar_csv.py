@@ -3,9 +3,13 @@
 Verificação rápida do CSV gerado
 """
 
-import pandas as pd
+import csv
+import itertools
+import sys
 from pathlib import Path
 
+from verify_common import contar_categorias, formatar_contagens, get_df
+
 print("🔍 VERIFICAÇÃO DO CSV GERADO")
 print("=" * 60)
 
@@ -15,17 +19,27 @@ if not csv_path.exists():
     exit(1)
 
 try:
-    df = pd.read_csv(csv_path)
-    print(f"✅ CSV carregado: {len(df)} registros")
-    print(f"📊 Colunas: {list(df.columns)}")
+    # Cabeçalho e prévia: só as 3 primeiras linhas, como texto (sem DataFrame)
+    # utf-8-sig descarta o BOM que o rank_auctioneers_real grava no início do arquivo
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        head = list(itertools.islice(csv.reader(f), 4))
+    colunas = head[0] if head else []
+    
+    # Uma única leitura, só das colunas usadas e com tipos fixos (cache compartilhado)
+    df = get_df(csv_path)
+    total = len(df)
+    
+    print(f"✅ CSV carregado: {total} registros")
+    print(f"📊 Colunas: {colunas}")
     
     print("\n📈 Estatísticas:")
-    print(f"Total de leiloeiros: {len(df)}")
+    print(f"Total de leiloeiros: {total}")
     
     if 'Categoria' in df.columns:
         print("\nDistribuição por Categoria:")
-        for cat, count in df['Categoria'].value_counts().items():
-            print(f"  {cat}: {count} ({count/len(df)*100:.1f}%)")
+        categorias = contar_categorias(df['Categoria'])
+        if categorias:
+            print(formatar_contagens(categorias, total, "  "))
     
     if 'Score' in df.columns:
         print(f"\nScore:")
@@ -34,7 +48,7 @@ try:
         print(f"  Máximo: {df['Score'].max()}")
     
     print("\n📋 Primeiras 3 linhas:")
-    print(df.head(3).to_string())
+    csv.writer(sys.stdout, lineterminator='\n').writerows(head)
     
 except Exception as e:
     print(f"❌ Erro: {e}")
@@ -4,15 +4,28 @@ Verificação final do sistema completo
 """
 
 import json
-import pandas as pd
 from pathlib import Path
 import sys
 
-def verificar_arquivos():
+try:
+    import orjson
+except ImportError:
+    # orjson é opcional; sem ele o JSON é lido com a biblioteca padrão
+    orjson = None
+
+from verify_common import (arquivos_existentes, checar_dashboard, colunas_csv, contar_categorias,
+                           contar_registros, count_nonempty, formatar_contagens, get_df)
+
+# src/ entra no path uma única vez, relativo ao script (o app é importado só no teste do dashboard)
+SRC_DIR = str(Path(__file__).resolve().parent / 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+def verificar_arquivos(p=print):
     """Verifica se todos os arquivos necessários existem"""
-    print("=" * 60)
-    print("🔍 VERIFICAÇÃO DE ARQUIVOS")
-    print("=" * 60)
+    p("=" * 60)
+    p("🔍 VERIFICAÇÃO DE ARQUIVOS")
+    p("=" * 60)
     
     arquivos = [
         ("data/raw/lista_completa_sp.json", "Dados brutos completos"),
@@ -23,92 +36,117 @@ def verificar_arquivos():
     ]
     
     todos_ok = True
+    existentes = arquivos_existentes(c for c, _ in arquivos)
     for caminho, descricao in arquivos:
         path = Path(caminho)
-        if path.exists():
-            print(f"✅ {descricao}: {caminho}")
+        if caminho in existentes:
+            p(f"✅ {descricao}: {caminho}")
             
             # Informações adicionais
             if caminho.endswith('.csv'):
                 try:
-                    df = pd.read_csv(path)
-                    print(f"   • Registros: {len(df)}")
-                    if 'tech_score' in df.columns:
-                        print(f"   • TechScore médio: {df['tech_score'].mean():.1f}")
+                    colunas = colunas_csv(path)
+                    if colunas and 'tech_score' not in colunas:
+                        # Só a contagem de linhas é exibida: dispensa o parse do CSV
+                        p(f"   • Registros: {contar_registros(path)}")
+                    else:
+                        df = get_df(path)
+                        p(f"   • Registros: {len(df)}")
+                        if 'tech_score' in df.columns:
+                            p(f"   • TechScore médio: {df['tech_score'].mean():.1f}")
                 except Exception as e:
-                    print(f"   • Erro ao ler: {e}")
+                    p(f"   • Erro ao ler: {e}")
             elif caminho.endswith('.json'):
                 try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    print(f"   • Registros: {len(data)}")
+                    if orjson is not None:
+                        data = orjson.loads(path.read_bytes())
+                    else:
+                        with open(path, 'r', encoding='utf-8') as f:
+                            data = json.load(f)
+                    p(f"   • Registros: {len(data)}")
                 except Exception as e:
-                    print(f"   • Erro ao ler: {e}")
+                    p(f"   • Erro ao ler: {e}")
         else:
-            print(f"❌ {descricao}: {caminho} (NÃO ENCONTRADO)")
+            p(f"❌ {descricao}: {caminho} (NÃO ENCONTRADO)")
             todos_ok = False
     
     return todos_ok
 
-def analisar_dados():
+def analisar_dados(p=print):
     """Analisa os dados processados"""
-    print("\n" + "=" * 60)
-    print("📊 ANÁLISE DOS DADOS PROCESSADOS")
-    print("=" * 60)
+    p("\n" + "=" * 60)
+    p("📊 ANÁLISE DOS DADOS PROCESSADOS")
+    p("=" * 60)
     
     csv_path = Path("data/relatorio_final_ranking.csv")
     if not csv_path.exists():
-        print("❌ Arquivo de dados não encontrado")
+        p("❌ Arquivo de dados não encontrado")
         return False
     
+    import numpy as np
+    import pandas as pd
+    
     try:
-        df = pd.read_csv(csv_path)
+        # Mesmo DataFrame já carregado em verificar_arquivos (cache compartilhado)
+        df = get_df(csv_path)
         total = len(df)
-        print(f"📈 Total de leiloeiros: {total}")
+        p(f"📈 Total de leiloeiros: {total}")
+        
+        # Agregações do TechScore calculadas juntas, uma leitura da coluna
+        stats = df['tech_score'].agg(['mean', 'min', 'max']) if 'tech_score' in df.columns else None
         
         if 'categoria' in df.columns:
-            print("\n🏷️ Distribuição por categoria:")
-            for cat, count in df['categoria'].value_counts().items():
-                print(f"   • {cat}: {count} ({count/total*100:.1f}%)")
+            p("\n🏷️ Distribuição por categoria:")
+            # Contagem única por categoria (códigos + bincount), reaproveitada nas oportunidades
+            cat_vc = contar_categorias(df['categoria'])
+            if cat_vc:
+                p(formatar_contagens(cat_vc, total, "   • "))
         
         if 'tech_score' in df.columns:
-            print(f"\n🎯 TechScore:")
-            print(f"   • Média: {df['tech_score'].mean():.1f}")
-            print(f"   • Mínimo: {df['tech_score'].min()}")
-            print(f"   • Máximo: {df['tech_score'].max()}")
+            media, minimo, maximo = stats['mean'], stats['min'], stats['max']
+            # O agg junta a média (float) com min/max; score inteiro volta a ser exibido como inteiro
+            if pd.api.types.is_integer_dtype(df['tech_score']) and pd.notna(minimo):
+                minimo, maximo = int(minimo), int(maximo)
+            p(f"\n🎯 TechScore:")
+            p(f"   • Média: {media:.1f}")
+            p(f"   • Mínimo: {minimo}")
+            p(f"   • Máximo: {maximo}")
             
             # Distribuição
-            print(f"\n📊 Distribuição do TechScore:")
-            bins = [0, 20, 40, 60, 80, 100]
+            p(f"\n📊 Distribuição do TechScore:")
             labels = ['0-20', '21-40', '41-60', '61-80', '81-100']
-            df['score_bin'] = pd.cut(df['tech_score'], bins=bins, labels=labels)
-            for label in labels:
-                count = len(df[df['score_bin'] == label])
-                if count > 0:
-                    print(f"   • {label}: {count} ({count/total*100:.1f}%)")
+            # Faixas (0,20], (20,40], ..., (80,100] como no pd.cut: índice = ceil(score/20) - 1,
+            # contado com um único np.bincount (scores fora de (0, 100] ficam de fora)
+            scores = df['tech_score'].to_numpy(dtype=np.float64, na_value=np.nan)
+            scores = scores[(scores > 0) & (scores <= 100)]
+            bin_counts = np.bincount(np.ceil(scores / 20).astype(np.intp) - 1, minlength=len(labels))
+            if bin_counts.any():
+                p(formatar_contagens(zip(labels, bin_counts), total, "   • "))
         
         if 'email_corporativo' in df.columns:
-            corporativos = df['email_corporativo'].sum()
-            print(f"\n📧 Emails corporativos: {int(corporativos)}/{total} ({corporativos/total*100:.1f}%)")
+            # Coluna booleana (nulo conta como não corporativo): np.count_nonzero conta os
+            # True direto no array, sem a soma genérica do pandas
+            corporativos = np.count_nonzero(df['email_corporativo'].to_numpy(dtype=bool, na_value=False))
+            p(f"\n📧 Emails corporativos: {corporativos}/{total} ({corporativos/total*100:.1f}%)")
         
         if 'site' in df.columns:
-            com_site = df[df['site'].notna() & (df['site'] != '')].shape[0]
-            print(f"🌐 Com site: {com_site}/{total} ({com_site/total*100:.1f}%)")
+            com_site = count_nonempty(df['site'])
+            p(f"🌐 Com site: {com_site}/{total} ({com_site/total*100:.1f}%)")
         
         # Oportunidades
         if 'categoria' in df.columns:
-            offline = len(df[df['categoria'] == 'Offline/Sem Site'])
-            pequenos = len(df[df['categoria'] == 'Pequeno (Com Site)'])
+            offline = cat_vc.get('Offline/Sem Site', 0)
+            pequenos = cat_vc.get('Pequeno (Com Site)', 0)
             oportunidades = offline + pequenos
-            print(f"\n🎯 OPORTUNIDADES DE NEGÓCIO:")
-            print(f"   • Offline/Sem Site: {offline} ({offline/total*100:.1f}%)")
-            print(f"   • Pequeno (Com Site): {pequenos} ({pequenos/total*100:.1f}%)")
-            print(f"   • TOTAL OPORTUNIDADES: {oportunidades} ({oportunidades/total*100:.1f}%)")
+            p(f"\n🎯 OPORTUNIDADES DE NEGÓCIO:")
+            p(f"   • Offline/Sem Site: {offline} ({offline/total*100:.1f}%)")
+            p(f"   • Pequeno (Com Site): {pequenos} ({pequenos/total*100:.1f}%)")
+            p(f"   • TOTAL OPORTUNIDADES: {oportunidades} ({oportunidades/total*100:.1f}%)")
         
         return True
         
     except Exception as e:
-        print(f"❌ Erro na análise: {e}")
+        p(f"❌ Erro na análise: {e}")
         return False
 
 def testar_dashboard():
@@ -125,8 +163,8 @@ def testar_dashboard():
     print("✅ Dashboard encontrado: src/app.py")
     
     try:
-        import sys
-        sys.path.insert(0, 'src')
+        # Só importa o app se ele puder carregar
+        checar_dashboard(app_path, ('load_data', 'create_sample_data'))
         from app import load_data, create_sample_data
         
         print("✅ Funções do dashboard importáveis")
@@ -144,47 +182,61 @@ def testar_dashboard():
         return False
 
 def main():
-    print("=" * 60)
-    print("🔧 VERIFICAÇÃO FINAL DO SISTEMA")
-    print("=" * 60)
+    # Linhas do relatório acumuladas e escritas de uma vez (uma escrita em vez de um print por linha)
+    OUT = []
+    p = OUT.append
     
-    # Verificar arquivos
-    arquivos_ok = verificar_arquivos()
+    def emitir():
+        if OUT:
+            sys.stdout.write('\n'.join(map(str, OUT)) + '\n')
+            sys.stdout.flush()
+            OUT.clear()
     
-    # Analisar dados
-    dados_ok = analisar_dados()
-    
-    # Testar dashboard
-    dashboard_ok = testar_dashboard()
-    
-    print("\n" + "=" * 60)
-    print("📋 RESUMO DA VERIFICAÇÃO")
-    print("=" * 60)
-    
-    if arquivos_ok and dados_ok and dashboard_ok:
-        print("✅ SISTEMA COMPLETO E FUNCIONAL!")
-        print("\n🚀 PRÓXIMOS PASSOS:")
-        print("1. Execute o dashboard: streamlit run src/app.py")
-        print("2. Acesse: http://localhost:8501")
-        print("3. Use os filtros para explorar os dados")
-        print("4. Identifique oportunidades de negócio")
-    else:
-        print("⚠️ ALGUNS PROBLEMAS FORAM ENCONTRADOS")
-        print("\n🔧 CORREÇÕES NECESSÁRIAS:")
-        if not arquivos_ok:
-            print("• Verifique se os arquivos de dados existem")
-        if not dados_ok:
-            print("• Execute o script de processamento: python src/processors/rank_everyone.py")
-        if not dashboard_ok:
-            print("• Verifique as dependências: pip install streamlit pandas")
-    
-    print("\n" + "=" * 60)
-    print("📞 INFORMAÇÕES DE CONTATO")
-    print("=" * 60)
-    print("Projeto: Mapa-Leiloeiros")
-    print("Status: Sistema de análise de oportunidades")
-    print("Data: 22/12/2025")
-    print("Versão: 2.0.0 (Inclusiva - Todos os 600+ leiloeiros)")
+    try:
+        p("=" * 60)
+        p("🔧 VERIFICAÇÃO FINAL DO SISTEMA")
+        p("=" * 60)
+        
+        # Verificar arquivos
+        arquivos_ok = verificar_arquivos(p)
+        
+        # Analisar dados
+        dados_ok = analisar_dados(p)
+        
+        # Teste do dashboard escreve ao vivo (import e carga podem demorar)
+        emitir()
+        dashboard_ok = testar_dashboard()
+        
+        p("\n" + "=" * 60)
+        p("📋 RESUMO DA VERIFICAÇÃO")
+        p("=" * 60)
+        
+        if arquivos_ok and dados_ok and dashboard_ok:
+            p("✅ SISTEMA COMPLETO E FUNCIONAL!")
+            p("\n🚀 PRÓXIMOS PASSOS:")
+            p("1. Execute o dashboard: streamlit run src/app.py")
+            p("2. Acesse: http://localhost:8501")
+            p("3. Use os filtros para explorar os dados")
+            p("4. Identifique oportunidades de negócio")
+        else:
+            p("⚠️ ALGUNS PROBLEMAS FORAM ENCONTRADOS")
+            p("\n🔧 CORREÇÕES NECESSÁRIAS:")
+            if not arquivos_ok:
+                p("• Verifique se os arquivos de dados existem")
+            if not dados_ok:
+                p("• Execute o script de processamento: python src/processors/rank_everyone.py")
+            if not dashboard_ok:
+                p("• Verifique as dependências: pip install streamlit pandas")
+        
+        p("\n" + "=" * 60)
+        p("📞 INFORMAÇÕES DE CONTATO")
+        p("=" * 60)
+        p("Projeto: Mapa-Leiloeiros")
+        p("Status: Sistema de análise de oportunidades")
+        p("Data: 22/12/2025")
+        p("Versão: 2.0.0 (Inclusiva - Todos os 600+ leiloeiros)")
+    finally:
+        emitir()
 
 if __name__ == "__main__":
     main()
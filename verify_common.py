@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Leitura compartilhada do CSV de ranking pelos scripts de verificação
+(verificar_tudo.py, verificacao_final.py, verificar_csv.py)
+"""
+
+import ast
+import csv
+import functools
+import importlib.util
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Sequence, Set
+
+# pandas e numpy são importados só quando usados: a verificação de arquivos
+# e os caminhos de erro (CSV ausente) não pagam a inicialização dessas bibliotecas
+if TYPE_CHECKING:
+    import pandas as pd
+
+@functools.lru_cache(maxsize=None)
+def engine_csv() -> str:
+    """Engine do pd.read_csv: leitor multithread do Arrow quando o pyarrow está instalado"""
+    # pyarrow é opcional; sem ele o CSV é lido pelo engine C do pandas
+    return 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+
+CSV_PATH = Path("data/relatorio_final_ranking.csv")
+
+# Únicas colunas consultadas pelas verificações
+COLS = ('Categoria', 'categoria', 'Score', 'TechScore', 'tech_score', 'email_corporativo', 'site')
+# Tipos fixos das colunas conhecidas do relatório, usados por todos os scripts que leem o CSV
+# (colunas ausentes são ignoradas); tipos anuláveis para não falhar com valores vazios
+DTYPES = {
+    'Categoria': 'category',
+    'categoria': 'category',
+    'tech_score': 'Int16',
+    'email_corporativo': 'boolean',
+    'site': 'string',
+}
+
+def arquivos_existentes(caminhos: Iterable[str]) -> Set[str]:
+    """
+    Subconjunto dos caminhos que existem, com um os.scandir por diretório
+    pai em vez de um stat por arquivo. Pai inexistente ou ilegível cai no Path.exists().
+    """
+    por_pai = defaultdict(list)
+    for caminho in caminhos:
+        path = Path(caminho)
+        por_pai[path.parent].append((caminho, path))
+    
+    existentes = set()
+    for pai, itens in por_pai.items():
+        try:
+            with os.scandir(pai) as entradas:
+                presentes = {e.name for e in entradas}
+        except OSError:
+            existentes.update(c for c, path in itens if path.exists())
+            continue
+        existentes.update(c for c, path in itens if path.name in presentes)
+    return existentes
+
+def checar_dashboard(app_path: Path, funcoes: Sequence[str]) -> None:
+    """
+    Confere, sem importar o app (o import executa o script do Streamlit), se o streamlit
+    está instalado e se app_path define as funções pedidas. Levanta ImportError se não.
+    """
+    if importlib.util.find_spec('streamlit') is None:
+        raise ImportError("No module named 'streamlit'")
+    definidas = {node.name for node in ast.parse(app_path.read_text(encoding='utf-8')).body
+                 if isinstance(node, ast.FunctionDef)}
+    faltando = [nome for nome in funcoes if nome not in definidas]
+    if faltando:
+        raise ImportError(f"funções não encontradas em {app_path}: {', '.join(faltando)}")
+
+def contar_categorias(series: 'pd.Series') -> dict:
+    """
+    Contagem por categoria, em ordem decrescente como no value_counts (sem as vazias).
+    Conta os códigos inteiros da coluna categórica com np.bincount, sem hashing.
+    """
+    import numpy as np
+    
+    cat = series.astype('category')
+    codes = cat.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(cat.cat.categories))
+    ordem = np.argsort(-counts, kind='stable')
+    return {cat.cat.categories[i]: int(counts[i]) for i in ordem if counts[i]}
+
+def formatar_contagens(contagens, total: int, prefixo: str) -> str:
+    """
+    Linhas '<prefixo>nome: n (p%)' dos pares (nome, contagem) não nulos, numa única
+    string; os percentuais saem de uma só operação vetorizada.
+    """
+    import numpy as np
+    
+    itens = [(nome, int(n)) for nome, n in (contagens.items() if hasattr(contagens, 'items') else contagens) if n]
+    pcts = np.array([n for _, n in itens], dtype=np.float64) / total * 100
+    return '\n'.join(f"{prefixo}{nome}: {n} ({pct:.1f}%)" for (nome, n), pct in zip(itens, pcts))
+
+def count_nonempty(series: 'pd.Series') -> int:
+    """Quantidade de valores não nulos e diferentes de '' (sem montar DataFrame filtrado)"""
+    arr = series.to_numpy(dtype=object, na_value='')
+    return int((arr != '').sum())
+
+def colunas_csv(csv_path: Path) -> list:
+    """Nomes das colunas (primeira linha do CSV), sem carregar o pandas"""
+    # utf-8-sig: o rank_auctioneers_real grava o CSV com BOM, que não pode ir para o nome da 1ª coluna
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+def contar_registros(csv_path: Path) -> int:
+    """
+    Linhas de dados do CSV (sem o cabeçalho) contando quebras de linha em blocos de 1 MB,
+    sem parse. Pressupõe registros de uma linha só (sem quebras dentro de campos).
+    """
+    linhas = 0
+    ultimo = b'\n'
+    with open(csv_path, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            linhas += bloco.count(b'\n')
+            ultimo = bloco[-1:]
+    if ultimo != b'\n':
+        linhas += 1  # última linha sem quebra no final
+    return max(linhas - 1, 0)
+
+def carregar_csv(csv_path: Path, usecols: list) -> 'pd.DataFrame':
+    """Carrega as colunas pedidas do CSV, com tipos fixos"""
+    import pandas as pd
+    
+    return pd.read_csv(csv_path, usecols=usecols, dtype=DTYPES, engine=engine_csv())
+
+@functools.lru_cache(maxsize=4)
+def _get_df_cached(path: str, mtime_ns: int) -> 'pd.DataFrame':
+    import pandas as pd
+    
+    csv_path = Path(path)
+    # Parse restrito às colunas usadas (ao menos uma, para a contagem de linhas continuar correta)
+    colunas = list(pd.read_csv(csv_path, nrows=0).columns)
+    usecols = [c for c in colunas if c in COLS] or colunas[:1]
+    return carregar_csv(csv_path, usecols)
+
+def get_df(csv_path: Path = CSV_PATH) -> 'pd.DataFrame':
+    """
+    DataFrame do CSV de ranking, lido uma vez por processo; o mtime na chave invalida o
+    cache se o arquivo mudar. O DataFrame é compartilhado e não deve ser alterado.
+    """
+    return _get_df_cached(str(csv_path), csv_path.stat().st_mtime_ns)